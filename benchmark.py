@@ -0,0 +1,860 @@
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+
+def time_call(func, *args, repeat=3, **kwargs):
+    """
+    Mesure le meilleur temps d'exécution d'une fonction.
+
+    Parameters:
+        func (callable): Fonction à mesurer.
+        repeat (int): Nombre de répétitions (le meilleur temps est conservé).
+
+    Returns:
+        best (float): Meilleur temps mesuré, en secondes.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_hawk_dove(sizes=(10**2, 10**3, 10**4, 10**5, 10**6, 10**7), generations=5):
+    """
+    Mesure le temps par génération du jeu Aigle-Colombe en fonction de N.
+
+    Parameters:
+        sizes (tuple): Tailles de population à mesurer.
+        generations (int): Nombre de générations par mesure.
+    """
+    from simulations.hawk_dove import hawk_dove_game
+
+    print(f"{'N':>10} {'s/génération':>14}")
+    for population_size in sizes:
+        elapsed = time_call(hawk_dove_game, 2.0, 3.0, population_size, generations)
+        print(f"{population_size:>10} {elapsed / generations:>14.2e}")
+
+
+def bench_hawk_dove_batch(replicates=10**4, population_size=1000, generations=50):
+    """
+    Compare R réplicats en mode batch à des exécutions individuelles successives.
+
+    Parameters:
+        replicates (int): Nombre de réplicats simulés en une seule fois.
+        population_size (int): Taille de chaque population.
+        generations (int): Nombre de générations.
+    """
+    from simulations.hawk_dove import hawk_dove_game, hawk_dove_game_batch
+
+    single = time_call(hawk_dove_game, 2.0, 3.0, population_size, generations)
+    batch = time_call(hawk_dove_game_batch, 2.0, 3.0, population_size, generations, replicates)
+    print(f"1 exécution individuelle : {single:.3e} s")
+    print(f"{replicates} réplicats en batch : {batch:.3e} s ({batch / single:.1f} exécutions individuelles)")
+
+
+def bench_hawk_dove_counts(sizes=(10**3, 10**6, 10**9), generations=100):
+    """
+    Mesure le temps par génération des mises à jour par effectifs (Wright-Fisher, Moran).
+
+    Parameters:
+        sizes (tuple): Tailles de population à mesurer.
+        generations (int): Nombre de générations par mesure.
+    """
+    from simulations.hawk_dove import UPDATE_RULES, hawk_dove_counts_game
+
+    print(f"{'N':>12} " + " ".join(f"{update:>14}" for update in UPDATE_RULES))
+    for population_size in sizes:
+        timings = [
+            time_call(hawk_dove_counts_game, 2.0, 3.0, population_size, generations, update=update) / generations
+            for update in UPDATE_RULES
+        ]
+        print(f"{population_size:>12} " + " ".join(f"{elapsed:>14.2e}" for elapsed in timings))
+
+
+def bench_hawk_dove_lattice(sizes=(256, 512, 1024, 2048), generations=5):
+    """
+    Mesure le temps par génération du jeu Aigle-Colombe sur grille.
+
+    Référence sur un cœur, voisinage de Moore : environ 0,05 s ("imitate-best")
+    et 0,09 s ("fermi") en 1024 × 1024, 0,2 s et 0,35 s en 2048 × 2048.
+
+    Parameters:
+        sizes (tuple): Côtés de grille à mesurer.
+        generations (int): Nombre de générations par mesure.
+    """
+    from simulations.hawk_dove import LATTICE_UPDATES, NEIGHBOURHOODS, hawk_dove_lattice
+
+    variants = [(neighbourhood, update) for update in LATTICE_UPDATES for neighbourhood in NEIGHBOURHOODS]
+    print(f"{'côté':>6} " + " ".join(f"{n + '/' + u:>26}" for n, u in variants))
+    for size in sizes:
+        timings = [
+            time_call(hawk_dove_lattice, 2.0, 3.0, size, generations, neighbourhood, update, repeat=1) / generations
+            for neighbourhood, update in variants
+        ]
+        print(f"{size:>6} " + " ".join(f"{elapsed:>26.2e}" for elapsed in timings))
+
+
+def bench_lotka_volterra_ensemble(members=(10, 100, 1000, 10000), steps=1000):
+    """
+    Compare l'intégration en ensemble à une boucle sur le chemin scalaire.
+
+    Parameters:
+        members (tuple): Nombres de jeux de paramètres à mesurer.
+        steps (int): Nombre de pas de temps.
+    """
+    from simulations.predator_prey import lotka_volterra_ensemble, lotka_volterra_with_payoff
+
+    scalar = time_call(lotka_volterra_with_payoff, 0.1, 0.02, 0.01, 0.1, 40, 9, steps)
+    print(f"{'membres':>8} {'ensemble (s)':>14} {'boucle scalaire (s)':>20}")
+    for count in members:
+        rng = np.random.default_rng(0)
+        alpha = rng.uniform(0.05, 0.15, count)
+        elapsed = time_call(lotka_volterra_ensemble, alpha, 0.02, 0.01, 0.1, 40, 9, steps, repeat=1)
+        print(f"{count:>8} {elapsed:>14.2e} {scalar * count:>20.2e}")
+
+
+def bench_lotka_volterra_adaptive(t_max=200.0, rtols=(1e-3, 1e-6, 1e-9)):
+    """
+    Compare la dérive de l'intégrale première de Lotka-Volterra entre le schéma
+    d'Euler à pas unitaire et l'intégrateur adaptatif, à nombre d'évaluations donné.
+
+    Parameters:
+        t_max (float): Durée simulée.
+        rtols (tuple): Tolérances relatives de l'intégrateur adaptatif.
+    """
+    from simulations.predator_prey import lotka_volterra_adaptive, lotka_volterra_with_payoff
+
+    alpha, beta, delta, gamma, prey_init, predator_init = 0.1, 0.02, 0.01, 0.1, 40, 9
+
+    def drift(prey, predator):
+        # Quantité conservée le long des orbites fermées du modèle continu
+        prey, predator = np.asarray(prey), np.asarray(predator)
+        invariant = delta * prey - gamma * np.log(prey) + beta * predator - alpha * np.log(predator)
+        return np.ptp(invariant)
+
+    steps = int(t_max)
+    elapsed = time_call(lotka_volterra_with_payoff, alpha, beta, delta, gamma, prey_init, predator_init, steps)
+    prey, predator, _ = lotka_volterra_with_payoff(alpha, beta, delta, gamma, prey_init, predator_init, steps)
+    print(f"Euler (pas 1)       évaluations={steps:>8} dérive={drift(prey, predator):.2e} temps={elapsed:.2e} s")
+
+    for rtol in rtols:
+        elapsed = time_call(lotka_volterra_adaptive, alpha, beta, delta, gamma, prey_init, predator_init, t_max, rtol=rtol)
+        _, prey, predator, _, events = lotka_volterra_adaptive(
+            alpha, beta, delta, gamma, prey_init, predator_init, t_max, rtol=rtol
+        )
+        print(f"Adaptatif rtol={rtol:.0e} évaluations={events['evaluations']:>8} "
+              f"dérive={drift(prey, predator):.2e} temps={elapsed:.2e} s")
+
+
+def bench_lotka_volterra_stochastic(replicates=1000):
+    """
+    Mesure le débit (réactions par seconde) des moteurs stochastiques.
+
+    Parameters:
+        replicates (int): Nombre de réplicats simulés ensemble.
+    """
+    from simulations.predator_prey import lotka_volterra_stochastic
+
+    # Petites populations (extinctions fréquentes) et grandes populations autour de l'équilibre
+    scenarios = {
+        "petites populations": ((1.0, 0.1, 0.075, 1.5, 10, 5, 30.0), ("gillespie", "tau-leaping")),
+        "grandes populations": ((1.0, 1e-4, 7.5e-5, 1.5, 20000, 10000, 10.0), ("tau-leaping",)),
+    }
+    for name, (parameters, methods) in scenarios.items():
+        for method in methods:
+            rng = np.random.default_rng(0)
+            start = time.perf_counter()
+            _, _, _, events = lotka_volterra_stochastic(*parameters, replicates=replicates, method=method, rng=rng)
+            elapsed = time.perf_counter() - start
+            extinct = np.mean(np.isfinite(events["extinction_times"]).any(axis=1))
+            print(f"{name:>20} {method:>12} : {events['events'] / elapsed:.2e} réactions/s, "
+                  f"{extinct:.0%} des réplicats éteints")
+
+
+def peak_memory(func, *args, **kwargs):
+    """
+    Mesure le pic de mémoire alloué par une fonction (suivi par tracemalloc).
+
+    Returns:
+        peak (int): Pic de mémoire, en octets.
+    """
+    tracemalloc.start()
+    try:
+        func(*args, **kwargs)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench_lotka_volterra_stream(step_counts=(10**4, 10**5, 10**6)):
+    """
+    Compare le pic de mémoire de l'historique en listes et de l'écriture en flux.
+
+    Parameters:
+        step_counts (tuple): Nombres de pas de temps à mesurer.
+    """
+    from simulations.predator_prey import lotka_volterra_to_npy, lotka_volterra_with_payoff
+
+    parameters = (0.1, 0.02, 0.01, 0.1, 40, 9)
+    print(f"{'pas':>10} {'listes (Mo)':>12} {'flux .npy (Mo)':>15}")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "trajectoire.npy")
+        for steps in step_counts:
+            lists = peak_memory(lotka_volterra_with_payoff, *parameters, steps)
+            stream = peak_memory(lotka_volterra_to_npy, path, *parameters, steps)
+            print(f"{steps:>10} {lists / 1e6:>12.2f} {stream / 1e6:>15.2f}")
+
+
+def bench_lotka_volterra_diffusion(sizes=(128, 256, 512, 1024), steps=10):
+    """
+    Mesure le temps par pas du modèle proie-prédateur spatial.
+
+    Parameters:
+        sizes (tuple): Côtés de grille à mesurer.
+        steps (int): Nombre de pas par mesure.
+    """
+    from simulations.predator_prey import DIFFUSION_METHODS, lotka_volterra_diffusion
+
+    print(f"{'côté':>6} " + " ".join(f"{method + ' (s/pas)':>16}" for method in DIFFUSION_METHODS))
+    for size in sizes:
+        timings = [
+            time_call(lotka_volterra_diffusion, 1.0, 0.1, 0.075, 1.5, 20, 10, steps,
+                      size=size, method=method, repeat=1) / steps
+            for method in DIFFUSION_METHODS
+        ]
+        print(f"{size:>6} " + " ".join(f"{elapsed:>16.2e}" for elapsed in timings))
+
+
+def bench_jackdaw(simulation_counts=(10**3, 10**4, 10**5, 10**6), iterations=50):
+    """
+    Mesure le temps du jeu des choucas en fonction du nombre de simulations.
+
+    Parameters:
+        simulation_counts (tuple): Nombres de simulations à mesurer.
+        iterations (int): Nombre d'interactions par simulation.
+    """
+    from simulations.jackdaw import jackdaw_game
+
+    print(f"{'simulations':>12} {'temps (s)':>10}")
+    for simulations in simulation_counts:
+        elapsed = time_call(jackdaw_game, simulations, iterations, repeat=1)
+        print(f"{simulations:>12} {elapsed:>10.2e}")
+
+
+def bench_multi_role(strategy_counts=(2, 8, 16, 32), roles=2, simulations=10**4, iterations=50):
+    """
+    Mesure le temps du jeu à K rôles en fonction du nombre de stratégies.
+
+    Parameters:
+        strategy_counts (tuple): Nombres de stratégies par rôle à mesurer.
+        roles (int): Nombre de rôles.
+        simulations (int): Nombre de simulations.
+        iterations (int): Nombre d'interactions par simulation.
+    """
+    from simulations.jackdaw import multi_role_game
+
+    print(f"{'stratégies':>11} {'temps (s)':>10}")
+    for strategies in strategy_counts:
+        rng = np.random.default_rng(0)
+        tensors = [rng.uniform(0, 5, (strategies,) * roles) for _ in range(roles)]
+        elapsed = time_call(multi_role_game, tensors, simulations=simulations, iterations=iterations, repeat=1)
+        print(f"{strategies:>11} {elapsed:>10.2e}")
+
+
+def bench_social_dominance(sizes=(50, 200, 1000), generations=5):
+    """
+    Mesure le temps de la simulation de dominance sociale, avec et sans journal des combats.
+
+    Parameters:
+        sizes (tuple): Tailles de population à mesurer.
+        generations (int): Nombre de générations par mesure.
+    """
+    from simulations.dominance import EventRecorder, social_dominance_simulation
+
+    print(f"{'N':>6} {'sans journal (s)':>17} {'avec journal (s)':>17}")
+    for population_size in sizes:
+        plain = time_call(social_dominance_simulation, population_size, generations, rng=0)
+        recorded = time_call(lambda: social_dominance_simulation(
+            population_size, generations, rng=0, recorder=EventRecorder(population_size * generations)))
+        print(f"{population_size:>6} {plain:>17.3e} {recorded:>17.3e}")
+
+
+def bench_living_index(population_size=10**5, fractions=(0.5, 0.1, 0.01, 0.001), draws=10**4):
+    """
+    Compare le tirage d'un adversaire vivant par rejet et par `LivingIndex` selon la fraction de survivants.
+
+    Parameters:
+        population_size (int): Taille de la population.
+        fractions (tuple): Fractions de survivants à mesurer.
+        draws (int): Nombre de tirages par mesure.
+    """
+    from simulations.dominance import LivingIndex
+
+    rng = np.random.default_rng(0)
+
+    def rejection(alive, individual):
+        for _ in range(draws):
+            opponent = rng.integers(0, population_size)
+            while opponent == individual or not alive[opponent]:
+                opponent = rng.integers(0, population_size)
+
+    def indexed(living, individual):
+        for _ in range(draws):
+            living.sample_other(individual, rng)
+
+    print(f"{'survivants':>10} {'rejet (s/tirage)':>17} {'index (s/tirage)':>17}")
+    for fraction in fractions:
+        survivors = max(2, int(population_size * fraction))
+        alive = np.zeros(population_size, dtype=bool)
+        alive[rng.choice(population_size, survivors, replace=False)] = True
+        living = LivingIndex(population_size)
+        for individual in np.flatnonzero(~alive):
+            living.remove(individual)
+        individual = living.members[0]
+        rejected = time_call(rejection, alive, individual, repeat=1)
+        sampled = time_call(indexed, living, individual, repeat=1)
+        print(f"{fraction:>10.1%} {rejected / draws:>17.2e} {sampled / draws:>17.2e}")
+
+
+def bench_social_dominance_rounds(sizes=(10**3, 10**4, 10**5, 10**6), generations=5, sequential_max=10**4):
+    """
+    Compare le temps par génération du moteur par rondes à la boucle individu par individu.
+
+    Le moteur par rondes est mesuré en enregistrant chaque génération (classement
+    compris) et sans historique. Référence sur un cœur, pour les premières
+    générations à N = 10⁶ : environ 0,42 s par génération enregistrée
+    (140 générations/min) et 0,24 s sans historique (250 générations/min).
+
+    Parameters:
+        sizes (tuple): Tailles de population à mesurer.
+        generations (int): Nombre de générations par mesure.
+        sequential_max (int): Taille maximale mesurée pour la boucle individu par individu.
+    """
+    from simulations.dominance import social_dominance_rounds, social_dominance_simulation
+
+    print(f"{'N':>8} {'boucle (s/gén.)':>16} {'rondes (s/gén.)':>16} {'gén./min':>9} "
+          f"{'sans hist. (s/gén.)':>20} {'gén./min':>9}")
+    for population_size in sizes:
+        rounds = time_call(social_dominance_rounds, population_size, generations, rng=0, repeat=1) / generations
+        unrecorded = time_call(social_dominance_rounds, population_size, generations, rng=0,
+                               record_every=generations + 1, repeat=1) / generations
+        if population_size <= sequential_max:
+            sequential = time_call(social_dominance_simulation, population_size, generations, rng=0, repeat=1)
+            sequential = f"{sequential / generations:>16.2e}"
+        else:
+            sequential = f"{'-':>16}"
+        print(f"{population_size:>8} {sequential} {rounds:>16.2e} {60 / rounds:>9.0f} "
+              f"{unrecorded:>20.2e} {60 / unrecorded:>9.0f}")
+
+
+def bench_dominance_ranks(sizes=(10**4, 10**5, 10**6), simulation_sizes=(10**3, 10**4), generations=5):
+    """
+    Compare le tri complet et le classement incrémental des rangs de dominance.
+
+    Mesure d'abord un classement isolé après 1000 changements de capacité, N / 256
+    (le seuil `INCREMENTAL_MAX_CHANGES`) et N, puis `social_dominance_simulation`
+    complète dans les deux modes, où environ N capacités changent par génération.
+
+    Parameters:
+        sizes (tuple): Tailles de population du classement isolé.
+        simulation_sizes (tuple): Tailles de population de la simulation complète.
+        generations (int): Nombre de générations simulées.
+    """
+    from simulations.dominance import DominanceRanking, dominance_ranks, social_dominance_simulation
+
+    rng = np.random.default_rng(0)
+    print(f"{'N':>8} {'changements':>12} {'tri complet (s)':>16} {'incrémental (s)':>16}")
+    for population_size in sizes:
+        fighting_ability = rng.uniform(0.5, 1.5, population_size)
+        alive = np.ones(population_size, dtype=bool)
+        death_order = np.zeros(population_size, dtype=int)
+        ranking = DominanceRanking(fighting_ability)
+        full = time_call(dominance_ranks, fighting_ability, alive, death_order)
+        for changes in (1000, population_size // 256, population_size):
+            changed = rng.integers(0, population_size, changes)
+
+            def update_and_rank():
+                for individual in changed:
+                    ranking.update(individual, fighting_ability[individual])
+                return ranking.ranks(death_order)
+
+            incremental = time_call(update_and_rank, repeat=1)
+            print(f"{population_size:>8} {changes:>12} {full:>16.2e} {incremental:>16.2e}")
+
+    print(f"\n{'N':>8} {'simulation tri (s/gén.)':>24} {'incrémentale (s/gén.)':>22}")
+    for population_size in simulation_sizes:
+        sort = time_call(social_dominance_simulation, population_size, generations, rng=0, repeat=1)
+        incremental = time_call(social_dominance_simulation, population_size, generations, rng=0,
+                                ranking="incremental", repeat=1)
+        print(f"{population_size:>8} {sort / generations:>24.2e} {incremental / generations:>22.2e}")
+
+
+def bench_hierarchy_metrics(sizes=(10**3, 10**4, 10**5, 10**6), generations=20):
+    """
+    Mesure le coût de l'enregistrement des victoires par paire et des indices de hiérarchie.
+
+    Parameters:
+        sizes (tuple): Tailles de population à mesurer.
+        generations (int): Nombre de générations (rondes) simulées.
+    """
+    from simulations.dominance import InteractionMatrix, davids_scores, landau_h, social_dominance_rounds, triangle_transitivity
+
+    print(f"{'N':>8} {'sans (s)':>10} {'avec (s)':>10} {'paires':>10} {'David (s)':>10} "
+          f"{'Landau (s)':>11} {'triangles (s)':>14}")
+    for population_size in sizes:
+        options = dict(mortality_risk=0.001, record_every=generations, rng=0)
+        plain = time_call(social_dominance_rounds, population_size, generations, repeat=1, **options)
+        interactions = InteractionMatrix(population_size)
+        recorded = time_call(social_dominance_rounds, population_size, generations, repeat=1,
+                             interactions=interactions, **options)
+        metrics = [time_call(metric, interactions, repeat=1)
+                   for metric in (davids_scores, landau_h, triangle_transitivity)]
+        print(f"{population_size:>8} {plain:>10.2e} {recorded:>10.2e} {len(interactions.pairs()[0]):>10} "
+              f"{metrics[0]:>10.2e} {metrics[1]:>11.2e} {metrics[2]:>14.2e}")
+
+
+def bench_social_dominance_history(population_size=10**5, generations=100, record_every=10):
+    """
+    Compare le pic de mémoire de l'historique de dominance selon son mode de stockage.
+
+    Parameters:
+        population_size (int): Taille de la population.
+        generations (int): Nombre de générations.
+        record_every (int): Décimation mesurée.
+    """
+    from simulations.dominance import social_dominance_rounds
+
+    run = lambda **options: peak_memory(
+        social_dominance_rounds, population_size, generations, mortality_risk=0.001, rng=0, **options)
+    with tempfile.TemporaryDirectory() as directory:
+        peaks = {
+            "toutes les générations": run(),
+            f"1 génération sur {record_every}": run(record_every=record_every),
+            "fichiers .npy projetés": run(history_dir=directory),
+        }
+    for name, peak in peaks.items():
+        print(f"{name:>24} : {peak / 1e6:>8.1f} Mo")
+
+
+def bench_convergence(window=20, tol=1e-6):
+    """
+    Mesure le temps gagné par l'arrêt à convergence des simulations.
+
+    Parameters:
+        window (int): Fenêtre du moniteur de convergence.
+        tol (float): Variance tolérée sur la fenêtre.
+    """
+    from simulations.jackdaw import jackdaw_game
+    from simulations.convergence import ConvergenceMonitor
+    from simulations.hawk_dove import hawk_dove_game_batch
+
+    runs = {
+        "hawk_dove_game_batch": lambda monitor: hawk_dove_game_batch(
+            2.0, 3.0, 200, 2000, 10000, rng=0, monitor=monitor),
+        "jackdaw_game": lambda monitor: jackdaw_game(20000, 2000, rng=0, monitor=monitor),
+    }
+    for name, run in runs.items():
+        full = time_call(run, None, repeat=1)
+        monitor = ConvergenceMonitor(window, tol)
+        start = time.perf_counter()
+        run(monitor)
+        early = time.perf_counter() - start
+        converged = monitor.converged_at[monitor.converged_at >= 0]
+        median = np.median(converged) if converged.size else float("nan")
+        print(f"{name:>22} : {full:.2e} s -> {early:.2e} s ({full / early:.1f}x), "
+              f"{converged.size / monitor.converged_at.size:.0%} convergés, médiane au pas {median:.0f}")
+
+
+def _cached_hawk_dove(directory, max_bytes, seed):
+    """Simulation Aigle-Colombe mise en cache, exécutée par un processus de `bench_result_cache`."""
+    from simulations.cache import ResultCache
+    from simulations.hawk_dove import hawk_dove_game
+
+    return ResultCache(directory, max_bytes).call(hawk_dove_game, 2.0, 3.0, 1000, 200, rng=seed % 8)
+
+
+def bench_result_cache(processes=4, tasks=64):
+    """
+    Mesure le temps d'un appel en cache contre une simulation complète, puis
+    vérifie le cache sous écritures concurrentes de plusieurs processus.
+
+    Parameters:
+        processes (int): Nombre de processus écrivant dans le même cache.
+        tasks (int): Nombre d'appels répartis entre les processus (8 graines distinctes).
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from simulations.cache import ResultCache
+    from simulations.dominance import social_dominance_simulation
+    from simulations.hawk_dove import hawk_dove_game
+    from simulations.jackdaw import jackdaw_game
+    from simulations.predator_prey import lotka_volterra_with_payoff
+
+    runs = {
+        "hawk_dove_game": (hawk_dove_game, (2.0, 3.0, 10**5, 200), {"rng": 0}),
+        "lotka_volterra_with_payoff": (lotka_volterra_with_payoff, (0.1, 0.02, 0.01, 0.1, 40, 9, 10**5), {}),
+        "jackdaw_game": (jackdaw_game, (10**4, 500), {"rng": 0}),
+        "social_dominance_simulation": (social_dominance_simulation, (500, 200), {"rng": 0}),
+    }
+    with tempfile.TemporaryDirectory() as directory:
+        cache = ResultCache(directory)
+        for name, (func, args, kwargs) in runs.items():
+            start = time.perf_counter()
+            cache.call(func, *args, **kwargs)
+            miss = time.perf_counter() - start
+            hit = time_call(cache.call, func, *args, repeat=5, **kwargs)
+            print(f"{name:>28} : calcul {miss:.2e} s, en cache {hit * 1e3:.2f} ms ({miss / hit:.0f}x)")
+
+    # Chaque résultat fait environ 2 ko : le plafond n'en garde que quelques-uns
+    with tempfile.TemporaryDirectory() as directory:
+        max_bytes = 3 * 2048
+        with ProcessPoolExecutor(processes) as pool:
+            results = list(pool.map(_cached_hawk_dove, [directory] * tasks, [max_bytes] * tasks, range(tasks)))
+        expected = [hawk_dove_game(2.0, 3.0, 1000, 200, rng=seed % 8) for seed in range(tasks)]
+        if not _same(results, expected):
+            raise SystemExit("ÉCHEC : résultats en cache différents des simulations")
+        cache = ResultCache(directory, max_bytes)
+        print(f"{processes} processus, {tasks} appels : résultats identiques, "
+              f"{len(os.listdir(directory))} fichiers, {cache.size()} octets (plafond {max_bytes})")
+
+
+def scaling_cases():
+    """
+    Chemins critiques mesurés par `bench_scaling`.
+
+    Returns:
+        cases (dict): Pour chaque simulateur, (paramètre varié, tailles, unité de
+            débit, fonction lançant la simulation pour une taille, travail effectué
+            pour une taille dans l'unité de débit).
+    """
+    from simulations.dominance import social_dominance_rounds, social_dominance_simulation
+    from simulations.hawk_dove import hawk_dove_game
+    from simulations.jackdaw import jackdaw_game
+    from simulations.predator_prey import lotka_volterra_with_payoff
+
+    return {
+        # Comptage des paires et rééchantillonnage de la population
+        "hawk_dove_game": (
+            "population_size", (10**3, 10**4, 10**5, 10**6), "individus·générations/s",
+            lambda n: hawk_dove_game(2.0, 3.0, n, 10, rng=0), lambda n: 10 * n,
+        ),
+        # Boucle scalaire pas à pas
+        "lotka_volterra_with_payoff": (
+            "steps", (10**3, 10**4, 3 * 10**4, 10**5), "pas/s",
+            lambda n: lotka_volterra_with_payoff(0.1, 0.02, 0.01, 0.1, 40, 9, n), lambda n: n,
+        ),
+        # Tirage des stratégies de toutes les simulations à chaque itération
+        "jackdaw_game": (
+            "simulations", (10**2, 10**3, 10**4, 10**5), "simulations·itérations/s",
+            lambda n: jackdaw_game(n, 50, rng=0), lambda n: 50 * n,
+        ),
+        # Boucle des combats, classement et copie de l'historique
+        "social_dominance_simulation": (
+            "population_size", (10**2, 10**3, 10**4, 3 * 10**4), "individus·générations/s",
+            lambda n: social_dominance_simulation(n, 10, rng=0), lambda n: 10 * n,
+        ),
+        # Rondes de combats simultanés, classement de chaque génération compris
+        # (environ 140 générations/min à N = 10⁶ sur un cœur)
+        "social_dominance_rounds": (
+            "population_size", (10**4, 10**5, 3 * 10**5, 10**6), "individus·générations/s",
+            lambda n: social_dominance_rounds(n, 5, rng=0), lambda n: 5 * n,
+        ),
+    }
+
+
+def fit_exponent(sizes, timings):
+    """
+    Ajuste l'exposant de complexité k de temps ∝ taille^k (régression en log-log).
+
+    Returns:
+        exponent (float): Pente de log(temps) en fonction de log(taille).
+    """
+    return float(np.polyfit(np.log(sizes), np.log(timings), 1)[0])
+
+
+def run_scaling(repeat=3):
+    """
+    Mesure chaque chemin critique sur sa gamme de tailles.
+
+    Parameters:
+        repeat (int): Nombre de répétitions par taille (le meilleur temps est conservé).
+
+    Returns:
+        results (dict): Résultats sérialisables en JSON : environnement de mesure et,
+            pour chaque simulateur, temps, débits, pics de mémoire et exposant ajusté.
+    """
+    import platform
+
+    results = {
+        "environment": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "processor": platform.processor(),
+        },
+        "cases": {},
+    }
+    for name, (parameter, sizes, unit, run, work) in scaling_cases().items():
+        timings = [time_call(run, size, repeat=repeat) for size in sizes]
+        results["cases"][name] = {
+            "parameter": parameter,
+            "sizes": list(sizes),
+            "unit": unit,
+            "time": timings,
+            "throughput": [work(size) / elapsed for size, elapsed in zip(sizes, timings)],
+            "peak_memory": [peak_memory(run, size) for size in sizes],
+            "exponent": fit_exponent(sizes, timings),
+        }
+    return results
+
+
+def compare_scaling(results, baseline, tolerance=0.25, exponent_tolerance=0.15):
+    """
+    Compare des mesures à une référence enregistrée par `bench_scaling`.
+
+    Parameters:
+        results (dict): Mesures de `run_scaling`.
+        baseline (dict): Mesures de référence.
+        tolerance (float): Hausse relative tolérée du temps et du pic de mémoire.
+        exponent_tolerance (float): Écart toléré sur l'exposant de complexité.
+
+    Returns:
+        regressions (list): Description de chaque régression détectée.
+    """
+    regressions = []
+    for name, case in results["cases"].items():
+        reference = baseline["cases"].get(name)
+        if reference is None:
+            continue
+        for size, elapsed, peak in zip(case["sizes"], case["time"], case["peak_memory"]):
+            if size not in reference["sizes"]:
+                continue
+            index = reference["sizes"].index(size)
+            if elapsed > reference["time"][index] * (1 + tolerance):
+                regressions.append(f"{name} {case['parameter']}={size} : temps "
+                                   f"{reference['time'][index]:.2e} s -> {elapsed:.2e} s")
+            if peak > reference["peak_memory"][index] * (1 + tolerance):
+                regressions.append(f"{name} {case['parameter']}={size} : mémoire "
+                                   f"{reference['peak_memory'][index]} -> {peak} octets")
+        if abs(case["exponent"] - reference["exponent"]) > exponent_tolerance:
+            regressions.append(f"{name} : exposant de complexité {reference['exponent']:.2f} -> {case['exponent']:.2f}")
+    return regressions
+
+
+def bench_scaling(baseline=None, save=None, tolerance=0.25, exponent_tolerance=0.15):
+    """
+    Mesure le temps, le débit et le pic de mémoire des chemins critiques de
+    chaque simulateur en fonction de la taille du problème, et ajuste leur
+    exposant de complexité.
+
+    Parameters:
+        baseline (str, optional): Fichier JSON de référence ; les régressions de
+            temps, de mémoire ou d'exposant font échouer la commande.
+        save (str, optional): Fichier JSON où enregistrer les mesures comme référence.
+        tolerance (float): Hausse relative tolérée du temps et du pic de mémoire.
+        exponent_tolerance (float): Écart toléré sur l'exposant de complexité.
+    """
+    import json
+
+    results = run_scaling()
+    for name, case in results["cases"].items():
+        print(f"{name} (exposant {case['exponent']:.2f})")
+        print(f"{case['parameter']:>16} {'temps (s)':>11} {case['unit']:>26} {'mémoire (octets)':>17}")
+        for size, elapsed, throughput, peak in zip(case["sizes"], case["time"], case["throughput"],
+                                                   case["peak_memory"]):
+            print(f"{size:>16} {elapsed:>11.2e} {throughput:>26.2e} {peak:>17}")
+
+    if save is not None:
+        with open(save, "w") as output:
+            json.dump(results, output, indent=2)
+        print(f"Référence enregistrée dans {save}")
+
+    if baseline is not None:
+        with open(baseline) as reference_file:
+            reference = json.load(reference_file)
+        if reference["environment"] != results["environment"]:
+            print(f"Attention : référence mesurée dans un autre environnement ({reference['environment']})")
+        regressions = compare_scaling(results, reference, tolerance, exponent_tolerance)
+        if regressions:
+            raise SystemExit("ÉCHEC : régressions par rapport à la référence :\n" + "\n".join(regressions))
+        print(f"OK : aucune régression par rapport à {baseline}")
+
+
+def bench_phases():
+    """Affiche le temps passé dans chaque phase des simulateurs et le surcoût des chronomètres."""
+    from simulations.dominance import social_dominance_simulation
+    from simulations.hawk_dove import hawk_dove_game
+    from simulations.jackdaw import jackdaw_game
+    from simulations.predator_prey import lotka_volterra_with_payoff
+    from simulations.profiling import PhaseProfiler
+
+    runs = {
+        "hawk_dove_game": lambda **options: hawk_dove_game(2.0, 3.0, 10**5, 50, rng=0, **options),
+        "lotka_volterra_with_payoff": lambda **options: lotka_volterra_with_payoff(
+            0.1, 0.02, 0.01, 0.1, 40, 9, 10**5, **options),
+        "jackdaw_game": lambda **options: jackdaw_game(10**4, 200, rng=0, **options),
+        "social_dominance_simulation": lambda **options: social_dominance_simulation(2000, 50, rng=0, **options),
+    }
+    profiler = PhaseProfiler()
+    for name, run in runs.items():
+        disabled = time_call(run)
+        enabled = time_call(run, profiler=PhaseProfiler())
+        run(profiler=profiler)
+        print(f"{name:>28} : {disabled:.2e} s sans chronomètres, {enabled:.2e} s avec ({enabled / disabled - 1:+.1%})")
+    print(profiler.report())
+
+
+IMPORT_PROBE = """
+import sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+heavy = sorted({{name.split(".")[0] for name in sys.modules}} & {{"matplotlib", "tkinter", "_tkinter"}})
+print(elapsed, ",".join(heavy))
+"""
+
+
+def bench_import_time(modules=("numpy", "simulations.hawk_dove", "simulations.predator_prey",
+                               "simulations.jackdaw", "simulations.dominance", "evolution_stable",
+                               "modele_demo_proie_predateur", "choucas", "domination_v2"), repeat=5):
+    """
+    Mesure le temps d'import de chaque module dans un nouvel interpréteur.
+
+    Parameters:
+        modules (tuple): Modules à importer.
+        repeat (int): Nombre d'interpréteurs lancés par module (le meilleur temps est conservé).
+    """
+    print(f"{'module':>30} {'import (s)':>11}  modules graphiques chargés")
+    for module in modules:
+        runs = []
+        for _ in range(repeat):
+            output = subprocess.run([sys.executable, "-c", IMPORT_PROBE.format(module=module)], check=True,
+                                    capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+            elapsed, heavy = output.stdout.split()[0], output.stdout.split()[1:]
+            runs.append((float(elapsed), heavy))
+        elapsed, heavy = min(runs)
+        print(f"{module:>30} {elapsed:>11.3f}  {', '.join(heavy) or 'aucun'}")
+
+
+def _same(first, second):
+    """Compare récursivement deux résultats de simulation, bit à bit."""
+    if isinstance(first, dict):
+        return first.keys() == second.keys() and all(_same(first[key], second[key]) for key in first)
+    if isinstance(first, (tuple, list)):
+        return len(first) == len(second) and all(_same(a, b) for a, b in zip(first, second))
+    if callable(first):
+        return _same(first(), second())
+    return np.array_equal(np.asarray(first), np.asarray(second), equal_nan=True)
+
+
+def check_reproducibility(seed=12345):
+    """
+    Vérifie que chaque simulateur donne des résultats identiques bit à bit pour
+    une même graine, y compris en parallèle quel que soit le nombre de processus.
+
+    Parameters:
+        seed (int): Graine utilisée pour toutes les vérifications.
+
+    Returns:
+        failures (list): Noms des vérifications en échec.
+    """
+    from simulations.jackdaw import jackdaw_game, multi_role_game
+    from simulations.dominance import social_dominance_rounds, social_dominance_simulation
+    from simulations.hawk_dove import hawk_dove_game, hawk_dove_game_batch, hawk_dove_lattice, hawk_dove_sweep
+    from simulations.predator_prey import lotka_volterra_diffusion, lotka_volterra_stochastic
+    from simulations.random_streams import parallel_map
+
+    runs = {
+        "hawk_dove_game": lambda: hawk_dove_game(2.0, 3.0, 200, 20, rng=seed),
+        "hawk_dove_game_batch": lambda: hawk_dove_game_batch(2.0, 3.0, 200, 20, 50, rng=seed, update="moran"),
+        "hawk_dove_lattice": lambda: hawk_dove_lattice(2.0, 3.0, 32, 5, update="fermi", rng=seed),
+        "jackdaw_game": lambda: jackdaw_game(200, 20, rng=seed),
+        "multi_role_game": lambda: multi_role_game([np.ones((3, 4)), np.ones((3, 4))], simulations=50, rng=seed),
+        "social_dominance_simulation": lambda: social_dominance_simulation(50, 5, rng=seed),
+        "social_dominance_rounds": lambda: social_dominance_rounds(50, 5, rng=seed),
+        "social_dominance_incremental": lambda: social_dominance_simulation(50, 5, rng=seed, ranking="incremental"),
+        "lotka_volterra_stochastic": lambda: lotka_volterra_stochastic(1.0, 0.1, 0.075, 1.5, 10, 5, 5.0, 20, rng=seed),
+        "lotka_volterra_diffusion": lambda: lotka_volterra_diffusion(1.0, 0.1, 0.075, 1.5, 20, 10, 5, size=16, rng=seed),
+    }
+    failures = [name for name, run in runs.items() if not _same(run(), run())]
+
+    tasks = [(2.0, cost, 100, 20, 10) for cost in (1.0, 2.0, 3.0, 4.0)]
+    by_workers = [parallel_map(hawk_dove_game_batch, tasks, seed=seed, workers=workers) for workers in (1, 2, 4)]
+    if not all(_same(by_workers[0], other) for other in by_workers[1:]):
+        failures.append("parallel_map")
+
+    with tempfile.TemporaryDirectory() as directory:
+        sweeps = [
+            np.array(hawk_dove_sweep([1.0, 2.0, 3.0], [1.0, 2.0], os.path.join(directory, str(workers)),
+                                     replicates=5, generations=10, seed=seed, workers=workers,
+                                     chunk_size=1)["final_hawk_fraction"])
+            for workers in (1, 3)
+        ]
+    if not _same(sweeps[0], sweeps[1]):
+        failures.append("hawk_dove_sweep")
+    return failures
+
+
+def bench_reproducibility():
+    """Affiche le résultat des vérifications de reproductibilité."""
+    failures = check_reproducibility()
+    if failures:
+        raise SystemExit(f"ÉCHEC : résultats différents pour une même graine : {failures}")
+    print("OK : résultats identiques pour une même graine")
+
+
+BENCHMARKS = {
+    "hawk_dove": bench_hawk_dove,
+    "hawk_dove_batch": bench_hawk_dove_batch,
+    "hawk_dove_counts": bench_hawk_dove_counts,
+    "hawk_dove_lattice": bench_hawk_dove_lattice,
+    "lotka_volterra_ensemble": bench_lotka_volterra_ensemble,
+    "lotka_volterra_adaptive": bench_lotka_volterra_adaptive,
+    "lotka_volterra_stochastic": bench_lotka_volterra_stochastic,
+    "lotka_volterra_stream": bench_lotka_volterra_stream,
+    "lotka_volterra_diffusion": bench_lotka_volterra_diffusion,
+    "jackdaw": bench_jackdaw,
+    "multi_role": bench_multi_role,
+    "social_dominance": bench_social_dominance,
+    "living_index": bench_living_index,
+    "social_dominance_rounds": bench_social_dominance_rounds,
+    "dominance_ranks": bench_dominance_ranks,
+    "hierarchy_metrics": bench_hierarchy_metrics,
+    "social_dominance_history": bench_social_dominance_history,
+    "convergence": bench_convergence,
+    "result_cache": bench_result_cache,
+    "scaling": bench_scaling,
+    "phases": bench_phases,
+    "import_time": bench_import_time,
+    "reproducibility": bench_reproducibility,
+}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mesures de performance des simulateurs.")
+    parser.add_argument("names", nargs="*", help=f"Benchmarks à exécuter parmi {sorted(BENCHMARKS)} (tous par défaut).")
+    parser.add_argument("--baseline", help="Référence JSON à laquelle comparer les mesures de scaling.")
+    parser.add_argument("--save-baseline", help="Fichier JSON où enregistrer les mesures de scaling.")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Hausse relative tolérée du temps et de la mémoire (scaling).")
+    parser.add_argument("--exponent-tolerance", type=float, default=0.15,
+                        help="Écart toléré sur l'exposant de complexité (scaling).")
+    args = parser.parse_args()
+    unknown = set(args.names) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"Benchmarks inconnus : {sorted(unknown)}")
+
+    for name in args.names or BENCHMARKS:
+        print(f"== {name} ==")
+        if name == "scaling":
+            bench_scaling(args.baseline, args.save_baseline, args.tolerance, args.exponent_tolerance)
+        else:
+            BENCHMARKS[name]()
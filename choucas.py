@@ -1,74 +1,6 @@
 import numpy as np
-import matplotlib.pyplot as plt
-import tkinter as tk
-from tkinter import ttk
 
-def jackdaw_game(simulations=100, iterations=50, payoff_matrix_male=None, payoff_matrix_female=None):
-    """
-    Simule un modèle de théorie des jeux pour analyser les comportements des choucas en stress.
-
-    Parameters:
-        simulations (int): Nombre de simulations à exécuter.
-        iterations (int): Nombre d'interactions par simulation.
-        payoff_matrix_male (np.array): Matrice de gains pour les stratégies mâles.
-        payoff_matrix_female (np.array): Matrice de gains pour les stratégies femelles.
-
-    Returns:
-        history (dict): Historique des proportions de stratégies des mâles et des femelles.
-    """
-    # Initialiser les matrices de gains par défaut si elles ne sont pas fournies
-    if payoff_matrix_male is None:
-        payoff_matrix_male = np.array([
-            [5, 2],  # Gains pour le mâle (consolation vs signalement, neutralité)
-            [3, 4]   # Gains pour le mâle (évitement vs signalement, neutralité)
-        ])
-    
-    if payoff_matrix_female is None:
-        payoff_matrix_female = np.array([
-            [5, 3],  # Gains pour la femelle (signalement vs consolation, évitement)
-            [2, 4]   # Gains pour la femelle (neutralité vs consolation, évitement)
-        ])
-
-    # Historique des proportions de stratégies
-    history = {
-        "male_consolation": [],
-        "male_avoidance": [],
-        "female_signal": [],
-        "female_neutral": []
-    }
-
-    for _ in range(simulations):
-        # Initialiser les comptages pour chaque stratégie
-        male_strategy_counts = np.array([50, 50])  # 50% consolation, 50% évitement
-        female_strategy_counts = np.array([50, 50])  # 50% signalement, 50% neutralité
-
-        for _ in range(iterations):
-            # Calculer les probabilités de choix basées sur les comptages
-            male_probs = male_strategy_counts / np.sum(male_strategy_counts)
-            female_probs = female_strategy_counts / np.sum(female_strategy_counts)
-
-            # Choisir les stratégies pour une interaction spécifique
-            male_choice = np.random.choice([0, 1], p=male_probs)
-            female_choice = np.random.choice([0, 1], p=female_probs)
-
-            # Obtenir les gains pour les choix respectifs
-            male_gain = payoff_matrix_male[male_choice, female_choice]
-            female_gain = payoff_matrix_female[male_choice, female_choice]
-
-            # Mettre à jour les comptages en fonction des gains
-            male_strategy_counts[male_choice] += male_gain
-            female_strategy_counts[female_choice] += female_gain
-
-        # Normaliser les comptages pour obtenir les proportions
-        total_male = np.sum(male_strategy_counts)
-        total_female = np.sum(female_strategy_counts)
-
-        history["male_consolation"].append(male_strategy_counts[0] / total_male)
-        history["male_avoidance"].append(male_strategy_counts[1] / total_male)
-        history["female_signal"].append(female_strategy_counts[0] / total_female)
-        history["female_neutral"].append(female_strategy_counts[1] / total_female)
-
-    return history
+from simulations.jackdaw import jackdaw_game
 
 def plot_results(history):
     """
@@ -77,6 +9,8 @@ def plot_results(history):
     Parameters:
         history (dict): Historique des proportions de stratégies des mâles et des femelles.
     """
+    import matplotlib.pyplot as plt
+
     plt.figure(figsize=(10, 6))
     
     # Tracer les proportions des stratégies pour les mâles
@@ -101,6 +35,8 @@ def plot_final_strategy_distribution(history):
     Parameters:
         history (dict): Historique des proportions de stratégies des mâles et des femelles.
     """
+    import matplotlib.pyplot as plt
+
     # Récupérer les proportions finales pour chaque stratégie
     final_male_consolation = history["male_consolation"][-1]
     final_male_avoidance = history["male_avoidance"][-1]
@@ -129,6 +65,9 @@ def get_payoff_matrix():
         payoff_matrix_male (np.array): Matrice de gains personnalisée pour les stratégies mâles.
         payoff_matrix_female (np.array): Matrice de gains personnalisée pour les stratégies femelles.
     """
+    import tkinter as tk
+    from tkinter import ttk
+
     def submit():
         # Récupérer les valeurs des champs d'entrée
         values = [float(entry.get()) for entry in entries]
@@ -179,10 +118,11 @@ def get_payoff_matrix():
 
     return submit()
 
-# Obtenir des matrices de gains personnalisées de l'utilisateur
-payoff_matrix_male, payoff_matrix_female = get_payoff_matrix()
+if __name__ == "__main__":
+    # Obtenir des matrices de gains personnalisées de l'utilisateur
+    payoff_matrix_male, payoff_matrix_female = get_payoff_matrix()
 
-# Exécuter la simulation avec les matrices de gains personnalisées
-history = jackdaw_game(simulations=100, iterations=50, payoff_matrix_male=payoff_matrix_male, payoff_matrix_female=payoff_matrix_female)
-plot_results(history)
-plot_final_strategy_distribution(history)
+    # Exécuter la simulation avec les matrices de gains personnalisées
+    history = jackdaw_game(simulations=100, iterations=50, payoff_matrix_male=payoff_matrix_male, payoff_matrix_female=payoff_matrix_female)
+    plot_results(history)
+    plot_final_strategy_distribution(history)
@@ -0,0 +1,18 @@
+"""
+Cœurs de calcul des simulations, sans interface graphique.
+
+Chaque module ne dépend que de NumPy et peut être importé par des scripts ou
+des processus de calcul ; les interfaces Tkinter et les graphiques Matplotlib
+restent dans les scripts à la racine du projet.
+
+Modules:
+    hawk_dove: Jeu Aigle-Colombe (population, batch, grille, balayage de paramètres).
+    predator_prey: Modèles proie-prédateur (Euler, adaptatif, stochastique, spatial).
+    jackdaw: Jeu des choucas et jeu à K rôles.
+    dominance: Dominance sociale, classements et indices de hiérarchie.
+    convergence: Arrêt des simulations à convergence.
+    random_streams: Générateurs aléatoires reproductibles et calcul parallèle.
+    runner: Exécution des simulations en arrière-plan (avancement, annulation).
+    cache: Cache disque des résultats de simulation.
+    profiling: Chronomètres par phase et profils cProfile des simulations.
+"""
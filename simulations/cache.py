@@ -0,0 +1,319 @@
+import glob
+import hashlib
+import inspect
+import json
+import logging
+import os
+import tempfile
+import time
+import zipfile
+
+import numpy as np
+
+# Arguments qui écrivent ailleurs que dans le résultat : une simulation qui les
+# reçoit n'est pas mise en cache
+SIDE_EFFECT_ARGUMENTS = ("monitor", "recorder", "interactions", "history_dir", "profiler")
+# Arguments sans effet sur le résultat, exclus de la clé
+IGNORED_ARGUMENTS = ("progress",)
+
+_code_versions = {}
+# Dossier du paquet : une simulation peut dépendre de n'importe lequel de ses modules
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def code_version(func):
+    """
+    Empreinte du code d'une simulation : sources de tous les modules du paquet,
+    source du module de la simulation s'il est hors du paquet, et version de NumPy.
+
+    Parameters:
+        func (callable): Simulation.
+
+    Returns:
+        version (str): Empreinte hexadécimale (calculée une fois par module).
+    """
+    module = inspect.getmodule(func)
+    if module.__name__ not in _code_versions:
+        paths = sorted(glob.glob(os.path.join(_PACKAGE_DIR, "*.py")))
+        module_path = os.path.abspath(inspect.getsourcefile(module))
+        if os.path.dirname(module_path) != _PACKAGE_DIR:
+            paths.append(module_path)
+        digest = hashlib.sha256(np.__version__.encode())
+        for path in paths:
+            digest.update(os.path.basename(path).encode())
+            with open(path, "rb") as source:
+                digest.update(source.read())
+        _code_versions[module.__name__] = digest.hexdigest()
+    return _code_versions[module.__name__]
+
+
+def _hash_value(digest, value):
+    """Ajoute une valeur d'argument (scalaire, tableau, liste, dictionnaire) à l'empreinte."""
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, np.random.SeedSequence):
+        digest.update(repr(("SeedSequence", value.entropy, value.spawn_key)).encode())
+    elif isinstance(value, (np.ndarray, list, tuple)):
+        array = np.ascontiguousarray(value)
+        if array.dtype == object:
+            raise TypeError("Tableau d'objets impossible à mettre en cache.")
+        digest.update(repr(("array", array.dtype.str, array.shape)).encode())
+        digest.update(array.tobytes())
+    elif isinstance(value, dict):
+        digest.update(b"dict")
+        for key in sorted(value):
+            digest.update(repr(key).encode())
+            _hash_value(digest, value[key])
+    elif isinstance(value, (int, float)) and not isinstance(value, bool) and float(value) == value:
+        # Les nombres sont comparés par valeur : 2 et 2.0 donnent la même clé
+        digest.update(repr(("number", float(value))).encode())
+    elif value is None or isinstance(value, (bool, int, str)):
+        digest.update(repr((type(value).__name__, value)).encode())
+    else:
+        raise TypeError(f"Argument impossible à mettre en cache : {type(value).__name__}.")
+
+
+def cache_key(func, *args, **kwargs):
+    """
+    Clé d'un appel de simulation : empreinte du nom de la fonction, de ses
+    paramètres (matrices de gains comprises), de la graine et de la version du code.
+
+    Les arguments sont rattachés à la signature de la fonction, valeurs par
+    défaut comprises : un appel positionnel et un appel nommé ont la même clé.
+    Les nombres sont comparés par valeur (`f(2, 3)` et `f(2.0, 3.0)` ont la
+    même clé) ; les tableaux, eux, sont comparés avec leur type.
+
+    Parameters:
+        func (callable): Simulation.
+
+    Returns:
+        key (str or None): Clé hexadécimale, ou None si l'appel ne peut pas être
+            mis en cache (graine absente ou générateur, argument à effet de bord).
+    """
+    bound = inspect.signature(func).bind(*args, **kwargs)
+    bound.apply_defaults()
+    arguments = bound.arguments
+    seed = arguments.get("rng")
+    if "rng" in arguments and not isinstance(seed, (int, np.integer, np.random.SeedSequence)):
+        return None
+    if any(arguments.get(name) is not None for name in SIDE_EFFECT_ARGUMENTS):
+        return None
+
+    digest = hashlib.sha256(f"{func.__module__}.{func.__qualname__}".encode())
+    digest.update(code_version(func).encode())
+    try:
+        for name, value in arguments.items():
+            if name not in IGNORED_ARGUMENTS:
+                digest.update(name.encode())
+                _hash_value(digest, value)
+    except (TypeError, ValueError):
+        return None
+    return digest.hexdigest()
+
+
+def _flatten(result, arrays):
+    """
+    Range les tableaux d'un résultat dans `arrays` et renvoie la description de sa structure.
+
+    Les scalaires Python (None, booléens, nombres, chaînes) sont écrits directement
+    dans la description.
+
+    Raises:
+        TypeError: Si le résultat contient des objets qu'un .npz ne peut pas
+            stocker sans pickle.
+    """
+    if isinstance(result, dict):
+        return {"type": "dict", "items": {key: _flatten(value, arrays) for key, value in result.items()}}
+    if isinstance(result, tuple):
+        return {"type": "tuple", "items": [_flatten(value, arrays) for value in result]}
+    if result is None or isinstance(result, (bool, int, float, str)):
+        return {"type": "value", "value": result}
+    array = np.asarray(result)
+    if isinstance(result, list) and array.dtype.kind in "OUS":
+        # Liste hétérogène (None, chaînes...) : élément par élément
+        return {"type": "items", "items": [_flatten(value, arrays) for value in result]}
+    if array.dtype.kind == "O":
+        raise TypeError(f"Résultat impossible à mettre en cache : {type(result).__name__} d'objets.")
+    name = f"a{len(arrays)}"
+    arrays[name] = array
+    kind = "list" if isinstance(result, list) else "array" if isinstance(result, np.ndarray) else "scalar"
+    return {"type": kind, "name": name}
+
+
+def _unflatten(layout, arrays):
+    """Reconstruit un résultat à partir de sa structure et de ses tableaux."""
+    if layout["type"] == "dict":
+        return {key: _unflatten(value, arrays) for key, value in layout["items"].items()}
+    if layout["type"] == "tuple":
+        return tuple(_unflatten(value, arrays) for value in layout["items"])
+    if layout["type"] == "items":
+        return [_unflatten(value, arrays) for value in layout["items"]]
+    if layout["type"] == "value":
+        return layout["value"]
+    array = arrays[layout["name"]]
+    if layout["type"] == "list":
+        return array.tolist()
+    if layout["type"] == "scalar":
+        return array[()]
+    return array
+
+
+class ResultCache:
+    """
+    Cache disque des résultats de simulation, adressé par le contenu des appels.
+
+    Chaque résultat est un fichier .npz compressé nommé par sa clé (voir
+    `cache_key`). Les fichiers sont écrits sous un nom temporaire puis renommés
+    par `os.replace`, de sorte que plusieurs processus peuvent lire et écrire le
+    même dossier sans jamais lire un fichier incomplet. La date de modification
+    d'un fichier est rafraîchie à chaque lecture ; au-delà de `max_bytes`, les
+    fichiers les moins récemment utilisés sont supprimés.
+
+    Les tableaux relus gardent leur type NumPy ; les listes sont relues comme des
+    listes de nombres Python.
+
+    Parameters:
+        directory (str): Dossier du cache (créé au besoin).
+        max_bytes (int): Taille totale maximale des fichiers du cache.
+    """
+
+    def __init__(self, directory, max_bytes=1 << 30):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.npz")
+
+    def get(self, key):
+        """
+        Lit un résultat.
+
+        Parameters:
+            key (str): Clé du résultat.
+
+        Returns:
+            result (object or None): Résultat, ou None s'il n'est pas dans le cache.
+        """
+        path = self._path(key)
+        try:
+            with np.load(path, allow_pickle=False) as blob:
+                arrays = {name: blob[name] for name in blob.files}
+            os.utime(path)
+            return _unflatten(json.loads(str(arrays.pop("__layout__"))), arrays)
+        except FileNotFoundError:
+            # Absent, ou supprimé par un autre processus entre-temps
+            return None
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile) as error:
+            logging.warning(f"Résultat illisible supprimé du cache : {path} ({error}).")
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            return None
+
+    def put(self, key, result):
+        """
+        Écrit un résultat, puis supprime les résultats les plus anciens si le cache est trop gros.
+
+        Parameters:
+            key (str): Clé du résultat.
+            result (object): Tableau, liste, tuple ou dictionnaire de tableaux et de scalaires.
+
+        Raises:
+            TypeError: Si le résultat contient des objets impossibles à stocker sans pickle.
+        """
+        arrays = {}
+        layout = _flatten(result, arrays)
+        arrays["__layout__"] = np.array(json.dumps(layout))
+
+        descriptor, temporary = tempfile.mkstemp(dir=self.directory, prefix=f".{key}.", suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as blob:
+                np.savez_compressed(blob, **arrays)
+            os.replace(temporary, self._path(key))
+        except BaseException:
+            os.unlink(temporary)
+            raise
+        self.evict()
+
+    def call(self, func, *args, **kwargs):
+        """
+        Renvoie le résultat en cache de `func(*args, **kwargs)`, en le calculant au besoin.
+
+        Les appels sans graine entière (rng absent ou générateur) ou avec un
+        argument à effet de bord (`monitor`, `recorder`...) sont exécutés sans cache.
+
+        Parameters:
+            func (callable): Simulation.
+
+        Returns:
+            result (object): Résultat de la simulation.
+        """
+        key = cache_key(func, *args, **kwargs)
+        if key is None:
+            return func(*args, **kwargs)
+        result = self.get(key)
+        if result is not None:
+            self.hits += 1
+            return result
+        self.misses += 1
+        result = func(*args, **kwargs)
+        try:
+            self.put(key, result)
+        except TypeError as error:
+            logging.warning(f"Résultat de {func.__qualname__} non mis en cache : {error}")
+        return result
+
+    def size(self):
+        """Taille totale des résultats du cache, en octets."""
+        return sum(size for _, size, _ in self._entries())
+
+    def _entries(self):
+        """Fichiers du cache : (chemin, taille, date de dernière utilisation)."""
+        entries = []
+        with os.scandir(self.directory) as scan:
+            for entry in scan:
+                if not entry.name.endswith(".npz"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((entry.path, stat.st_size, stat.st_mtime))
+        return entries
+
+    def evict(self, stale_after=3600):
+        """
+        Supprime les résultats les moins récemment utilisés au-delà de `max_bytes`,
+        ainsi que les fichiers temporaires abandonnés depuis `stale_after` secondes.
+        """
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in sorted(entries, key=lambda entry: entry[2]):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass  # Déjà supprimé par un autre processus
+            total -= size
+
+        deadline = time.time() - stale_after
+        with os.scandir(self.directory) as scan:
+            for entry in scan:
+                try:
+                    if entry.name.endswith(".tmp") and entry.stat().st_mtime < deadline:
+                        os.unlink(entry.path)
+                except FileNotFoundError:
+                    pass
+
+    def clear(self):
+        """Supprime tous les résultats du cache."""
+        for path, _, _ in self._entries():
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
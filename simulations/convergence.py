@@ -0,0 +1,80 @@
+import numpy as np
+
+
+class ConvergenceMonitor:
+    """
+    Détecte la convergence des proportions de stratégies d'une ou plusieurs simulations.
+
+    À chaque pas, le simulateur transmet les proportions de ses réplicats encore
+    actifs. Un réplicat a convergé lorsque la variance de chacune de ses
+    proportions sur les `window` derniers pas est inférieure ou égale à `tol` :
+    il est alors retiré des réplicats actifs et le simulateur cesse de le faire
+    évoluer.
+
+    La variance est évaluée sur des fenêtres successives disjointes, à la fin
+    de chacune : un pas ordinaire ne fait que recopier les proportions, et la
+    convergence est détectée au plus `window - 1` pas après qu'elle a eu lieu.
+
+    Les simulateurs appellent `reset` au début de chaque simulation : un même
+    moniteur peut servir à plusieurs simulations successives, ses attributs
+    décrivant alors la dernière.
+
+    Attributes:
+        window (int): Nombre de pas de chaque fenêtre.
+        tol (float): Variance maximale tolérée sur la fenêtre.
+        index (ndarray): Indices des réplicats encore actifs.
+        converged_at (ndarray): Pas auquel chaque réplicat a convergé (-1 sinon).
+        steps (int): Nombre de pas observés.
+    """
+
+    def __init__(self, window=20, tol=1e-5):
+        self.window = window
+        self.tol = tol
+        self.reset()
+
+    def reset(self):
+        """Oublie les pas observés, avant une nouvelle simulation."""
+        self.index = None
+        self.converged_at = None
+        self.steps = 0
+        self._buffer = None
+
+    @property
+    def done(self):
+        """Vrai lorsque tous les réplicats ont convergé."""
+        return self.index is not None and self.index.size == 0
+
+    def update(self, values, step=None):
+        """
+        Enregistre les proportions du pas courant.
+
+        Parameters:
+            values (ndarray): Proportions des réplicats actifs, de forme (actifs,)
+                ou (actifs, proportions), dans l'ordre de `index`.
+            step (int, optional): Numéro du pas (par défaut, le nombre de pas observés).
+
+        Returns:
+            keep (ndarray): Masque des réplicats qui restent actifs, à utiliser
+                pour retirer les réplicats convergés des tableaux du simulateur.
+        """
+        values = np.asarray(values, dtype=float).reshape(len(values), -1)
+        if self.index is None:
+            self.index = np.arange(len(values))
+            self.converged_at = np.full(len(values), -1)
+            self._buffer = np.zeros((self.window,) + values.shape)
+
+        self._buffer[self.steps % self.window, :len(values)] = values
+        self.steps += 1
+        step = self.steps if step is None else step
+
+        if self.steps % self.window:
+            return np.ones(len(values), dtype=bool)
+
+        window = self._buffer[:, :len(values)]
+        keep = np.max(np.var(window, axis=0), axis=1) > self.tol
+        if not keep.all():
+            self.converged_at[self.index[~keep]] = step
+            self.index = self.index[keep]
+            # La fenêtre suivante repart de zéro : inutile de recopier l'ancienne
+            self._buffer = self._buffer[:, :keep.sum()]
+        return keep
@@ -0,0 +1,190 @@
+import numpy as np
+
+from .random_streams import make_rng
+
+
+def _check_counts(counts, when):
+    """
+    Vérifie que des comptages peuvent servir de poids de tirage.
+
+    Parameters:
+        counts (list): Comptages de chaque rôle, de forme (simulations, n_k).
+        when (str): Moment de la vérification, pour le message d'erreur.
+
+    Raises:
+        ValueError: Si un comptage est négatif ou non fini, ou si un rôle n'a
+            plus aucun comptage dans une simulation.
+    """
+    for role, role_counts in enumerate(counts):
+        if not np.all(np.isfinite(role_counts)) or np.any(role_counts < 0):
+            raise ValueError(f"Les comptages du rôle {role} doivent être finis et positifs ({when}).")
+        if np.any(np.sum(role_counts, axis=1) <= 0):
+            raise ValueError(f"Les comptages du rôle {role} ont une somme nulle ({when}).")
+
+
+def jackdaw_game(simulations=100, iterations=50, payoff_matrix_male=None, payoff_matrix_female=None, rng=None,
+                 monitor=None, profiler=None):
+    """
+    Simule un modèle de théorie des jeux pour analyser les comportements des choucas en stress.
+
+    Parameters:
+        simulations (int): Nombre de simulations à exécuter.
+        iterations (int): Nombre d'interactions par simulation.
+        payoff_matrix_male (np.array): Matrice de gains pour les stratégies mâles.
+        payoff_matrix_female (np.array): Matrice de gains pour les stratégies femelles.
+        rng (int or np.random.Generator, optional): Graine ou générateur aléatoire, voir `make_rng`.
+        monitor (ConvergenceMonitor, optional): Arrête chaque simulation à convergence
+            (voir `multi_role_game`).
+        profiler (PhaseProfiler, optional): Chronomètre les phases de la simulation
+            (voir `multi_role_game`).
+
+    Returns:
+        history (dict): Historique des proportions de stratégies des mâles et des femelles
+            (un tableau de longueur `simulations` par stratégie).
+    """
+    # Initialiser les matrices de gains par défaut si elles ne sont pas fournies
+    if payoff_matrix_male is None:
+        payoff_matrix_male = np.array([
+            [5, 2],  # Gains pour le mâle (consolation vs signalement, neutralité)
+            [3, 4]   # Gains pour le mâle (évitement vs signalement, neutralité)
+        ])
+    
+    if payoff_matrix_female is None:
+        payoff_matrix_female = np.array([
+            [5, 3],  # Gains pour la femelle (signalement vs consolation, évitement)
+            [2, 4]   # Gains pour la femelle (neutralité vs consolation, évitement)
+        ])
+
+    # Les deux matrices sont indexées par (choix du mâle, choix de la femelle)
+    proportions = multi_role_game(
+        [payoff_matrix_male, payoff_matrix_female],
+        initial_counts=[[50, 50], [50, 50]],  # 50% consolation / évitement, 50% signalement / neutralité
+        simulations=simulations,
+        iterations=iterations,
+        rng=rng,
+        monitor=monitor,
+        profiler=profiler,
+    )
+    male_proportions, female_proportions = proportions
+
+    # Historique des proportions de stratégies, une valeur par simulation
+    history = {
+        "male_consolation": male_proportions[:, 0],
+        "male_avoidance": male_proportions[:, 1],
+        "female_signal": female_proportions[:, 0],
+        "female_neutral": female_proportions[:, 1]
+    }
+
+    return history
+
+def multi_role_game(payoff_tensors, initial_counts=None, simulations=100, iterations=50, rng=None, monitor=None,
+                    profiler=None):
+    """
+    Simule un jeu à K rôles (sexes, castes...) ayant chacun plusieurs stratégies.
+
+    À chaque interaction, chaque rôle choisit une stratégie avec une probabilité
+    proportionnelle à son comptage, puis le comptage de la stratégie choisie
+    augmente du gain obtenu. Toutes les simulations et tous les rôles sont tirés
+    ensemble, avec un seul tirage de nombres uniformes par interaction.
+
+    Parameters:
+        payoff_tensors (list): Un tableau de gains par rôle, de forme (n_1, ..., n_K) :
+            l'élément [s_1, ..., s_K] est le gain du rôle pour ces choix conjoints.
+            Les gains négatifs sont permis tant que les comptages restent positifs.
+        initial_counts (list, optional): Comptages initiaux de chaque rôle
+            (par défaut, 50 pour chaque stratégie), positifs et de somme non nulle.
+        simulations (int): Nombre de simulations à exécuter.
+        iterations (int): Nombre d'interactions par simulation.
+        rng (int or np.random.Generator, optional): Graine ou générateur aléatoire, voir `make_rng`.
+        monitor (ConvergenceMonitor, optional): Arrête chaque simulation dès que
+            les proportions de tous les rôles ont convergé ; `monitor.converged_at`
+            donne l'interaction de convergence.
+        profiler (PhaseProfiler, optional): Chronomètre les phases "setup",
+            "probabilities", "convergence", "sampling" (tirage des stratégies)
+            et "payoffs" (mise à jour des comptages).
+
+    Returns:
+        proportions (list): Pour chaque rôle, proportions finales des stratégies,
+            de forme (simulations, n_k).
+
+    Raises:
+        ValueError: Si les tenseurs de gains n'ont pas la même forme, si un gain
+            n'est pas fini, ou si un comptage devient négatif ou de somme nulle.
+    """
+    if profiler is not None:
+        profiler.start("multi_role_game")
+    rng = make_rng(rng)
+    payoff_tensors = [np.asarray(tensor) for tensor in payoff_tensors]
+    shape = payoff_tensors[0].shape
+    if len(shape) != len(payoff_tensors) or any(tensor.shape != shape for tensor in payoff_tensors):
+        raise ValueError(f"Chacun des {len(payoff_tensors)} rôles doit avoir un tenseur de gains de même forme, à un axe par rôle.")
+    if not all(np.all(np.isfinite(tensor)) for tensor in payoff_tensors):
+        raise ValueError("Les gains doivent être finis.")
+    if initial_counts is None:
+        initial_counts = [np.full(strategies, 50.0) for strategies in shape]
+    if [len(role_counts) for role_counts in initial_counts] != list(shape):
+        raise ValueError(f"Les comptages initiaux doivent avoir {list(shape)} stratégies par rôle.")
+    _check_counts([np.atleast_2d(role_counts) for role_counts in initial_counts], "comptages initiaux")
+    # Avec des gains positifs, les comptages ne peuvent que croître : inutile de les revérifier
+    negative_payoffs = any(np.any(tensor < 0) for tensor in payoff_tensors)
+
+    if monitor is not None:
+        monitor.reset()
+
+    # Une ligne de comptages par simulation et par rôle, en flottants pour
+    # ne pas tronquer les gains fractionnaires ou négatifs
+    rows = np.arange(simulations)
+    counts = [np.tile(np.asarray(role_counts, dtype=float), (simulations, 1)) for role_counts in initial_counts]
+    # Comptages définitifs, y compris ceux des simulations arrêtées à convergence
+    final_counts = counts
+    active = rows
+    if profiler is not None:
+        profiler.lap("setup")
+
+    for iteration in range(iterations):
+        probs = [role_counts / np.sum(role_counts, axis=1, keepdims=True) for role_counts in counts]
+        if profiler is not None:
+            profiler.lap("probabilities")
+
+        # Proportions atteintes après `iteration` interactions
+        if monitor is not None and iteration:
+            keep = monitor.update(np.hstack(probs), step=iteration)
+            if not keep.all():
+                # Retirer les simulations convergées en conservant leurs comptages
+                if final_counts is counts:
+                    final_counts = [role_counts.copy() for role_counts in counts]
+                for final, role_counts in zip(final_counts, counts):
+                    final[active[~keep]] = role_counts[~keep]
+                counts = [role_counts[keep] for role_counts in counts]
+                probs = [role_probs[keep] for role_probs in probs]
+                active = active[keep]
+                rows = np.arange(len(active))
+                if not len(active):
+                    break
+            if profiler is not None:
+                profiler.lap("convergence")
+
+        uniforms = rng.random((len(active), len(counts)))
+        choices = []
+        for role, role_probs in enumerate(probs):
+            # Même règle que np.random.choice : nombre de bornes de la fonction de
+            # répartition inférieures ou égales au tirage uniforme
+            cdf = np.cumsum(role_probs[:, :-1], axis=1)
+            choices.append(np.sum(cdf <= uniforms[:, role:role + 1], axis=1))
+        if profiler is not None:
+            profiler.lap("sampling")
+
+        # Gains de chaque rôle pour les choix conjoints, puis mise à jour des comptages
+        for role_counts, tensor, choice in zip(counts, payoff_tensors, choices):
+            gain = tensor[tuple(choices)]
+            role_counts[rows, choice] = role_counts[rows, choice] + gain
+        if negative_payoffs:
+            _check_counts(counts, f"interaction {iteration + 1}")
+        if profiler is not None:
+            profiler.lap("payoffs")
+
+    if final_counts is not counts:
+        for final, role_counts in zip(final_counts, counts):
+            final[active] = role_counts
+
+    return [role_counts / np.sum(role_counts, axis=1, keepdims=True) for role_counts in final_counts]
@@ -0,0 +1,685 @@
+import numpy as np
+
+from .random_streams import make_rng
+
+# Simulation du modèle proie-prédateur avec matrice de payoffs
+def lotka_volterra_with_payoff(alpha, beta, delta, gamma, prey_init, predator_init, steps, progress=None,
+                               profiler=None):
+    """
+    Simule le modèle proie-prédateur Lotka-Volterra avec une matrice de payoffs.
+
+    Parameters:
+        alpha (float): Taux de croissance des proies.
+        beta (float): Taux de prédation.
+        delta (float): Taux de reproduction des prédateurs.
+        gamma (float): Taux de mortalité des prédateurs.
+        prey_init (int): Population initiale des proies.
+        predator_init (int): Population initiale des prédateurs.
+        steps (int): Nombre de pas de temps.
+        progress (callable, optional): Appelée avec (pas effectués, pas prévus) après
+            chaque pas de temps ; peut lever une exception pour interrompre la simulation.
+        profiler (PhaseProfiler, optional): Chronomètre les phases "populations"
+            (mise à jour et historique) et "payoffs". Les tours de chronomètre
+            coûtent de l'ordre d'une microseconde, comparable à un pas de temps.
+
+    Returns:
+        prey_history (list): Évolution de la population des proies.
+        predator_history (list): Évolution de la population des prédateurs.
+        payoff_matrix (ndarray): Matrice des payoffs calculée au fil du temps.
+    """
+    if profiler is not None:
+        profiler.start("lotka_volterra_with_payoff")
+    # Initialisation des populations
+    prey = prey_init
+    predator = predator_init
+    prey_history = [prey]
+    predator_history = [predator]
+
+    # Matrice de payoffs
+    payoff_matrix = np.zeros((2, 2))
+
+    for step in range(steps):
+        # Calcul des changements de population
+        prey_change = alpha * prey - beta * prey * predator
+        predator_change = delta * prey * predator - gamma * predator
+
+        # Mise à jour des populations
+        prey = max(prey + prey_change, 0)
+        predator = max(predator + predator_change, 0)
+
+        # Mise à jour de l'historique
+        prey_history.append(prey)
+        predator_history.append(predator)
+        if profiler is not None:
+            profiler.lap("populations")
+
+        # Mise à jour des payoffs
+        payoff_matrix[0, 0] += prey * alpha
+        payoff_matrix[0, 1] += -beta * prey * predator
+        payoff_matrix[1, 0] += delta * prey * predator
+        payoff_matrix[1, 1] += -gamma * predator
+        if profiler is not None:
+            profiler.lap("payoffs")
+
+        if progress is not None:
+            progress(step + 1, steps)
+
+    return prey_history, predator_history, payoff_matrix
+
+# Simulation d'un ensemble de modèles proie-prédateur en parallèle
+def lotka_volterra_ensemble(alpha, beta, delta, gamma, prey_init, predator_init, steps, out=None):
+    """
+    Simule plusieurs modèles Lotka-Volterra à la fois, un par jeu de paramètres.
+
+    Les paramètres et populations initiales sont des tableaux (ou des scalaires)
+    diffusés les uns contre les autres : chaque élément est un membre de
+    l'ensemble. Tous les membres avancent ensemble par opérations sur tableaux,
+    avec exactement les mêmes calculs que `lotka_volterra_with_payoff`.
+
+    Parameters:
+        alpha, beta, delta, gamma (array-like): Taux du modèle pour chaque membre.
+        prey_init (array-like): Populations initiales des proies.
+        predator_init (array-like): Populations initiales des prédateurs.
+        steps (int): Nombre de pas de temps.
+        out (tuple, optional): Tableaux préalloués (prey_history, predator_history,
+            payoff_matrices) dans lesquels écrire les résultats.
+
+    Returns:
+        prey_history (ndarray): Évolution des proies, de forme (members, steps + 1).
+        predator_history (ndarray): Évolution des prédateurs, de forme (members, steps + 1).
+        payoff_matrices (ndarray): Matrices des payoffs, de forme (members, 2, 2).
+    """
+    alpha, beta, delta, gamma, prey_init, predator_init = (
+        np.ravel(array) for array in np.broadcast_arrays(
+            *(np.asarray(value, dtype=np.float64) for value in (alpha, beta, delta, gamma, prey_init, predator_init))
+        )
+    )
+    members = prey_init.size
+
+    if out is None:
+        prey_history = np.empty((members, steps + 1))
+        predator_history = np.empty((members, steps + 1))
+        payoff_matrices = np.empty((members, 2, 2))
+    else:
+        prey_history, predator_history, payoff_matrices = out
+    payoff_matrices[...] = 0
+
+    prey = prey_history[:, 0]
+    predator = predator_history[:, 0]
+    prey[:] = prey_init
+    predator[:] = predator_init
+
+    for step in range(steps):
+        # Calcul des changements de population
+        prey_change = alpha * prey - beta * prey * predator
+        predator_change = delta * prey * predator - gamma * predator
+
+        # Mise à jour des populations, directement dans l'historique
+        prey = np.maximum(prey + prey_change, 0, out=prey_history[:, step + 1])
+        predator = np.maximum(predator + predator_change, 0, out=predator_history[:, step + 1])
+
+        # Mise à jour des payoffs
+        payoff_matrices[:, 0, 0] += prey * alpha
+        payoff_matrices[:, 0, 1] += -beta * prey * predator
+        payoff_matrices[:, 1, 0] += delta * prey * predator
+        payoff_matrices[:, 1, 1] += -gamma * predator
+
+    return prey_history, predator_history, payoff_matrices
+
+# Coefficients de la paire de Runge-Kutta emboîtée de Dormand-Prince 5(4)
+DOPRI_C = np.array([0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1, 1])
+DOPRI_A = [
+    [],
+    [1 / 5],
+    [3 / 40, 9 / 40],
+    [44 / 45, -56 / 15, 32 / 9],
+    [19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729],
+    [9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656],
+    [35 / 384, 0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84],
+]
+DOPRI_B = np.array([35 / 384, 0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84, 0])
+DOPRI_B_STAR = np.array([5179 / 57600, 0, 7571 / 16695, 393 / 640, -92097 / 339200, 187 / 2100, 1 / 40])
+
+
+def _lotka_volterra_rhs(state, alpha, beta, delta, gamma):
+    """
+    Dérivées du modèle proie-prédateur, augmentées des intégrandes des payoffs.
+
+    L'état contient les deux populations suivies des quatre payoffs cumulés :
+    intégrer ces derniers avec le même schéma que les populations donne la
+    quadrature des payoffs sur les pas acceptés.
+    """
+    prey, predator = state[0], state[1]
+    predation = prey * predator
+    return np.array([
+        alpha * prey - beta * predation,
+        delta * predation - gamma * predator,
+        prey * alpha,
+        -beta * predation,
+        delta * predation,
+        -gamma * predator,
+    ])
+
+
+def _hermite(t0, y0, f0, t1, y1, f1, t):
+    """Interpolation cubique d'Hermite de l'état entre deux pas acceptés."""
+    h = t1 - t0
+    s = (t - t0) / h
+    return (
+        (1 + 2 * s) * (1 - s) ** 2 * y0 + s * (1 - s) ** 2 * h * f0
+        + s ** 2 * (3 - 2 * s) * y1 + s ** 2 * (s - 1) * h * f1
+    )
+
+
+def _locate_event(t0, y0, f0, t1, y1, f1, event, iterations=60):
+    """Localise par dichotomie l'instant où `event(state)` s'annule dans [t0, t1]."""
+    low, high = t0, t1
+    g_low = event(y0)
+    for _ in range(iterations):
+        middle = (low + high) / 2
+        g_middle = event(_hermite(t0, y0, f0, t1, y1, f1, middle))
+        if np.sign(g_middle) == np.sign(g_low):
+            low, g_low = middle, g_middle
+        else:
+            high = middle
+    return high, _hermite(t0, y0, f0, t1, y1, f1, high)
+
+
+# Simulation adaptative du modèle proie-prédateur avec détection d'événements
+def lotka_volterra_adaptive(alpha, beta, delta, gamma, prey_init, predator_init, t_max,
+                            rtol=1e-6, atol=1e-9, extinction_threshold=1e-6,
+                            stop_on_cycle=False, cycles=1, max_steps=1_000_000):
+    """
+    Intègre le modèle Lotka-Volterra en temps continu avec un pas adaptatif.
+
+    Le schéma d'Euler à pas unitaire de `lotka_volterra_with_payoff` est remplacé
+    par la paire de Runge-Kutta emboîtée de Dormand-Prince 5(4) : le pas est
+    ajusté pour respecter les tolérances sur les deux populations. Les payoffs
+    sont intégrés avec les populations (quadrature sur les pas acceptés).
+
+    L'intégration s'arrête avant `t_max` si une population passe sous
+    `extinction_threshold` (dès l'instant 0 si elle y est déjà), ou, si
+    `stop_on_cycle` est vrai, une fois `cycles` cycles complets refermés. Un
+    cycle est repéré par le passage croissant des proies par leur valeur
+    d'équilibre gamma / delta.
+
+    Parameters:
+        alpha (float): Taux de croissance des proies.
+        beta (float): Taux de prédation.
+        delta (float): Taux de reproduction des prédateurs.
+        gamma (float): Taux de mortalité des prédateurs.
+        prey_init (float): Population initiale des proies.
+        predator_init (float): Population initiale des prédateurs.
+        t_max (float): Durée maximale de la simulation.
+        rtol (float): Tolérance relative sur les populations.
+        atol (float): Tolérance absolue sur les populations.
+        extinction_threshold (float): Population en dessous de laquelle une espèce est éteinte.
+        stop_on_cycle (bool): Arrêter l'intégration une fois `cycles` cycles refermés.
+        cycles (int): Nombre de cycles complets avant l'arrêt (si `stop_on_cycle`).
+        max_steps (int): Nombre maximal de pas tentés, acceptés ou rejetés.
+
+    Returns:
+        times (ndarray): Instants des pas acceptés.
+        prey_history (ndarray): Population des proies à ces instants.
+        predator_history (ndarray): Population des prédateurs à ces instants.
+        payoff_matrix (ndarray): Matrice des payoffs intégrée sur [0, t_final].
+        events (dict): "extinction" (None ou (instant, "prey"/"predator")),
+            "crossings" (instants de passage par la section), "period" (période
+            moyenne ou None), "amplitude" ((proies, prédateurs) sur le dernier
+            cycle ou None) et "evaluations" (nombre d'évaluations des dérivées).
+    """
+    args = (alpha, beta, delta, gamma)
+    equilibrium_prey = gamma / delta
+
+    def section(state):
+        return state[0] - equilibrium_prey
+
+    def extinction(state):
+        return min(state[0], state[1]) - extinction_threshold
+
+    t = 0.0
+    state = np.array([prey_init, predator_init, 0, 0, 0, 0], dtype=float)
+    derivative = _lotka_volterra_rhs(state, *args)
+    evaluations = 1
+    times, prey_history, predator_history = [t], [state[0]], [state[1]]
+    crossings = []
+    extinct = None
+    if extinction(state) <= 0:
+        # Espèce déjà éteinte à l'instant initial : rien à intégrer
+        extinct = (t, "prey" if state[0] <= state[1] else "predator")
+
+    # Pas initial : une fraction de l'échelle de temps caractéristique
+    scale = atol + rtol * np.abs(state[:2])
+    h = min(0.01 * np.max(scale / (np.abs(derivative[:2]) + 1e-300)), t_max)
+    stages = np.empty((7, state.size))
+
+    for _ in range(max_steps):
+        if t >= t_max or extinct is not None:
+            break
+        h = min(h, t_max - t)
+
+        stages[0] = derivative
+        for i in range(1, 7):
+            stages[i] = _lotka_volterra_rhs(state + h * np.dot(DOPRI_A[i], stages[:i]), *args)
+        evaluations += 6
+        new_state = state + h * np.dot(DOPRI_B, stages)
+        error = h * np.dot(DOPRI_B - DOPRI_B_STAR, stages)[:2]
+
+        scale = atol + rtol * np.maximum(np.abs(state[:2]), np.abs(new_state[:2]))
+        error_norm = np.sqrt(np.mean((error / scale) ** 2))
+        if error_norm > 1:
+            h *= max(0.2, 0.9 * error_norm ** -0.2)
+            continue
+
+        # Pas accepté : la dernière étape est la dérivée au nouveau point (FSAL)
+        new_t = t + h
+        new_derivative = stages[6].copy()
+
+        if extinction(new_state) <= 0:
+            new_t, new_state = _locate_event(t, state, derivative, new_t, new_state, new_derivative, extinction)
+            extinct = (float(new_t), "prey" if new_state[0] <= new_state[1] else "predator")
+        elif section(state) < 0 <= section(new_state):
+            crossing, _ = _locate_event(t, state, derivative, new_t, new_state, new_derivative, section)
+            crossings.append(float(crossing))
+            if stop_on_cycle and len(crossings) > cycles:
+                new_t, new_state = crossing, _hermite(t, state, derivative, new_t, new_state, new_derivative, crossing)
+
+        t, state, derivative = new_t, new_state, new_derivative
+        times.append(t)
+        prey_history.append(state[0])
+        predator_history.append(state[1])
+
+        if extinct is not None or (stop_on_cycle and len(crossings) > cycles):
+            break
+        h *= min(5.0, 0.9 * max(error_norm, 1e-10) ** -0.2)
+
+    times = np.array(times)
+    prey_history = np.array(prey_history)
+    predator_history = np.array(predator_history)
+    payoff_matrix = state[2:].reshape(2, 2)
+
+    period = amplitude = None
+    if len(crossings) >= 2:
+        period = float(np.mean(np.diff(crossings)))
+        last_cycle = (times >= crossings[-2]) & (times <= crossings[-1])
+        amplitude = (float(np.ptp(prey_history[last_cycle])), float(np.ptp(predator_history[last_cycle])))
+
+    events = {
+        "extinction": extinct,
+        "crossings": crossings,
+        "period": period,
+        "amplitude": amplitude,
+        "evaluations": evaluations,
+    }
+    return times, prey_history, predator_history, payoff_matrix, events
+
+# Effet de chaque réaction sur (proies, prédateurs) : naissance d'une proie,
+# prédation, naissance d'un prédateur, mort d'un prédateur
+REACTION_CHANGES = np.array([[1, 0], [-1, 0], [0, 1], [0, -1]])
+STOCHASTIC_METHODS = ("gillespie", "tau-leaping")
+
+
+def _reaction_rates(prey, predator, alpha, beta, delta, gamma):
+    """Taux des quatre réactions pour chaque réplicat, de forme (R, 4)."""
+    predation = prey * predator
+    return np.stack([alpha * prey, beta * predation, delta * predation, gamma * predator], axis=-1)
+
+
+# Simulation stochastique individu-centrée du modèle proie-prédateur
+def lotka_volterra_stochastic(alpha, beta, delta, gamma, prey_init, predator_init, t_max,
+                              replicates=100, method="gillespie", tau=0.01, samples=201,
+                              stop_on_extinction=True, rng=None):
+    """
+    Simule le modèle proie-prédateur comme un processus de naissance et de mort.
+
+    Les populations sont des effectifs entiers. Les quatre réactions ont les
+    mêmes taux que `lotka_volterra_with_payoff` : naissance d'une proie
+    (alpha * proies), prédation (beta * proies * prédateurs), naissance d'un
+    prédateur (delta * proies * prédateurs) et mort d'un prédateur
+    (gamma * prédateurs). Tous les réplicats avancent ensemble :
+        - "gillespie" : algorithme exact de Gillespie (SSA), un événement par
+          réplicat et par itération ;
+        - "tau-leaping" : nombre d'événements de chaque réaction tiré selon une
+          loi de Poisson sur des pas de durée `tau`, adapté aux grandes populations.
+
+    Parameters:
+        alpha (float): Taux de croissance des proies.
+        beta (float): Taux de prédation.
+        delta (float): Taux de reproduction des prédateurs.
+        gamma (float): Taux de mortalité des prédateurs.
+        prey_init (int): Population initiale des proies.
+        predator_init (int): Population initiale des prédateurs.
+        t_max (float): Durée de la simulation.
+        replicates (int): Nombre de réplicats indépendants (R).
+        method (str): Méthode de simulation, parmi STOCHASTIC_METHODS.
+        tau (float): Durée d'un pas de tau-leaping.
+        samples (int): Nombre d'instants d'enregistrement, régulièrement espacés sur [0, t_max].
+        stop_on_extinction (bool): Figer un réplicat dès qu'une espèce s'éteint
+            (sans prédateurs, les proies croissent sans limite). Un réplicat dont
+            aucune réaction n'est possible reste de toute façon figé.
+        rng (int or np.random.Generator, optional): Graine ou générateur aléatoire, voir `make_rng`.
+
+    Returns:
+        times (ndarray): Instants d'enregistrement.
+        prey_history (ndarray): Proies à ces instants, de forme (R, samples).
+        predator_history (ndarray): Prédateurs à ces instants, de forme (R, samples).
+        events (dict): "extinction_times" (instant d'extinction des proies et des
+            prédateurs, de forme (R, 2), inf si l'espèce survit) et "events"
+            (nombre total de réactions simulées).
+    """
+    if method not in STOCHASTIC_METHODS:
+        raise ValueError(f"Méthode inconnue : {method} (attendu : {STOCHASTIC_METHODS}).")
+    rng = make_rng(rng)
+
+    times = np.linspace(0, t_max, samples)
+    prey_history = np.empty((replicates, samples), dtype=np.int64)
+    predator_history = np.empty((replicates, samples), dtype=np.int64)
+    extinction_times = np.full((replicates, 2), np.inf)
+
+    populations = np.empty((replicates, 2), dtype=np.int64)
+    populations[:, 0] = prey_init
+    populations[:, 1] = predator_init
+    extinction_times[populations == 0] = 0.0
+    total_events = 0
+
+    def running():
+        # Réplicats dont l'état peut encore évoluer
+        if stop_on_extinction:
+            return np.all(populations > 0, axis=1)
+        return np.any(populations > 0, axis=1)
+
+    if method == "gillespie":
+        t = np.zeros(replicates)
+        next_sample = np.zeros(replicates, dtype=np.int64)
+        active = np.flatnonzero(running())
+
+        while active.size:
+            rates = _reaction_rates(populations[active, 0], populations[active, 1], alpha, beta, delta, gamma)
+            cumulative = np.cumsum(rates, axis=1)
+            total_rate = cumulative[:, -1]
+            # Sans réaction possible (alpha = 0 sans prédateurs, par exemple),
+            # l'état reste figé jusqu'à t_max : aucun événement ne survient
+            frozen = total_rate == 0
+            new_t = t[active] + rng.exponential(1.0, active.size) / np.where(frozen, 1.0, total_rate)
+            new_t[frozen] = np.inf
+
+            # Enregistrer l'état courant pour les instants antérieurs au prochain événement
+            recording, recording_t = active, new_t
+            while recording.size:
+                due = next_sample[recording] < samples
+                due[due] = times[next_sample[recording[due]]] < recording_t[due]
+                recording, recording_t = recording[due], recording_t[due]
+                prey_history[recording, next_sample[recording]] = populations[recording, 0]
+                predator_history[recording, next_sample[recording]] = populations[recording, 1]
+                next_sample[recording] += 1
+
+            firing = new_t <= t_max
+            active, new_t, cumulative, total_rate = (
+                active[firing], new_t[firing], cumulative[firing], total_rate[firing]
+            )
+            # Choix de la réaction proportionnellement à son taux
+            reaction = np.sum(cumulative < (rng.random(active.size) * total_rate)[:, None], axis=1)
+            populations[active] += REACTION_CHANGES[reaction]
+            t[active] = new_t
+            total_events += active.size
+
+            rows, species = np.nonzero(populations[active] == 0)
+            first = np.isinf(extinction_times[active[rows], species])
+            extinction_times[active[rows[first]], species[first]] = new_t[rows[first]]
+            active = active[running()[active]]
+
+        # Les réplicats figés gardent leur dernier état jusqu'à t_max
+        for replicate in np.flatnonzero(next_sample < samples):
+            prey_history[replicate, next_sample[replicate]:] = populations[replicate, 0]
+            predator_history[replicate, next_sample[replicate]:] = populations[replicate, 1]
+    else:
+        next_sample = 0
+        steps = int(np.ceil(t_max / tau))
+        for step in range(steps + 1):
+            t = step * tau
+            # Enregistrer l'état courant pour tous les instants déjà atteints
+            while next_sample < samples and times[next_sample] <= t:
+                prey_history[:, next_sample] = populations[:, 0]
+                predator_history[:, next_sample] = populations[:, 1]
+                next_sample += 1
+            if step == steps:
+                break
+
+            rates = _reaction_rates(populations[:, 0], populations[:, 1], alpha, beta, delta, gamma)
+            rates[~running()] = 0
+            firings = rng.poisson(rates * tau)
+            total_events += int(firings.sum())
+            np.maximum(populations + firings @ REACTION_CHANGES, 0, out=populations)
+
+            extinct = (populations == 0) & np.isinf(extinction_times)
+            extinction_times[extinct] = t + tau
+
+        prey_history[:, next_sample:] = populations[:, :1]
+        predator_history[:, next_sample:] = populations[:, 1:]
+
+    events = {"extinction_times": extinction_times, "events": total_events}
+    return times, prey_history, predator_history, events
+
+# Simulation en flux du modèle proie-prédateur, par blocs de taille fixe
+def iter_lotka_volterra(alpha, beta, delta, gamma, prey_init, predator_init, steps, chunk_size=65536):
+    """
+    Simule le modèle proie-prédateur en produisant l'historique par blocs.
+
+    Les calculs sont exactement ceux de `lotka_volterra_with_payoff`, mais
+    l'historique n'est jamais conservé en entier : la mémoire utilisée reste
+    constante quelle que soit la durée de la simulation. Les blocs renvoyés
+    sont réutilisés d'une itération à l'autre et doivent être copiés s'ils
+    sont conservés.
+
+    Parameters:
+        alpha (float): Taux de croissance des proies.
+        beta (float): Taux de prédation.
+        delta (float): Taux de reproduction des prédateurs.
+        gamma (float): Taux de mortalité des prédateurs.
+        prey_init (int): Population initiale des proies.
+        predator_init (int): Population initiale des prédateurs.
+        steps (int): Nombre de pas de temps.
+        chunk_size (int): Nombre de pas de temps par bloc.
+
+    Yields:
+        prey_block (ndarray): Populations des proies du bloc (le premier bloc
+            commence par la population initiale).
+        predator_block (ndarray): Populations des prédateurs du bloc.
+        payoff_matrix (ndarray): Matrice des payoffs cumulée jusqu'à la fin du bloc.
+    """
+    prey_buffer = np.empty(chunk_size)
+    predator_buffer = np.empty(chunk_size)
+    payoff_matrix = np.zeros((2, 2))
+
+    prey = prey_init
+    predator = predator_init
+    prey_buffer[0] = prey
+    predator_buffer[0] = predator
+    filled = 1
+    remaining = steps
+
+    while True:
+        count = min(chunk_size - filled, remaining)
+        # Les payoffs sont cumulés dans des flottants Python pendant le bloc
+        payoff_00, payoff_01, payoff_10, payoff_11 = payoff_matrix.ravel().tolist()
+        for index in range(filled, filled + count):
+            prey_change = alpha * prey - beta * prey * predator
+            predator_change = delta * prey * predator - gamma * predator
+
+            prey = max(prey + prey_change, 0)
+            predator = max(predator + predator_change, 0)
+
+            prey_buffer[index] = prey
+            predator_buffer[index] = predator
+
+            payoff_00 += prey * alpha
+            payoff_01 += -beta * prey * predator
+            payoff_10 += delta * prey * predator
+            payoff_11 += -gamma * predator
+
+        payoff_matrix[:] = [[payoff_00, payoff_01], [payoff_10, payoff_11]]
+        filled += count
+        remaining -= count
+        yield prey_buffer[:filled], predator_buffer[:filled], payoff_matrix
+
+        if remaining == 0:
+            break
+        filled = 0
+
+
+def lotka_volterra_to_npy(path, alpha, beta, delta, gamma, prey_init, predator_init, steps, chunk_size=65536):
+    """
+    Écrit l'historique d'une simulation proie-prédateur dans un fichier .npy.
+
+    Les blocs de `iter_lotka_volterra` sont copiés directement dans un fichier
+    projeté en mémoire de forme (2, steps + 1) : ligne 0 pour les proies,
+    ligne 1 pour les prédateurs.
+
+    Parameters:
+        path (str): Chemin du fichier .npy à créer.
+        alpha, beta, delta, gamma (float): Taux du modèle.
+        prey_init (int): Population initiale des proies.
+        predator_init (int): Population initiale des prédateurs.
+        steps (int): Nombre de pas de temps.
+        chunk_size (int): Nombre de pas de temps par bloc.
+
+    Returns:
+        history (np.memmap): Historique projeté en mémoire, en lecture seule.
+        payoff_matrix (ndarray): Matrice des payoffs calculée au fil du temps.
+    """
+    history = np.lib.format.open_memmap(path, mode="w+", dtype=np.float64, shape=(2, steps + 1))
+    start = 0
+    payoff_matrix = np.zeros((2, 2))
+    for prey_block, predator_block, payoff_matrix in iter_lotka_volterra(
+        alpha, beta, delta, gamma, prey_init, predator_init, steps, chunk_size
+    ):
+        stop = start + len(prey_block)
+        history[0, start:stop] = prey_block
+        history[1, start:stop] = predator_block
+        history.flush()
+        start = stop
+    del history
+    return np.load(path, mmap_mode="r"), payoff_matrix.copy()
+
+# Modèle proie-prédateur spatial avec diffusion
+DIFFUSION_METHODS = ("stencil", "fft")
+
+
+def _laplacian(grid):
+    """Laplacien discret à 5 points avec bords périodiques."""
+    return (
+        np.roll(grid, 1, axis=0) + np.roll(grid, -1, axis=0)
+        + np.roll(grid, 1, axis=1) + np.roll(grid, -1, axis=1)
+        - 4 * grid
+    )
+
+
+def _laplacian_eigenvalues(shape):
+    """Valeurs propres (négatives) du laplacien à 5 points périodique, pour rfft2."""
+    ky = 2 * np.pi * np.fft.fftfreq(shape[0])[:, None]
+    kx = 2 * np.pi * np.fft.rfftfreq(shape[1])[None, :]
+    return -4 * np.sin(ky / 2) ** 2 - 4 * np.sin(kx / 2) ** 2
+
+
+def lotka_volterra_diffusion(alpha, beta, delta, gamma, prey_init, predator_init, steps,
+                             size=256, dt=0.1, prey_diffusion=0.2, predator_diffusion=0.1,
+                             method="stencil", perturbation=0.01, payoff_every=1, rng=None):
+    """
+    Simule le modèle proie-prédateur sur une grille avec diffusion des espèces.
+
+    Chaque cellule applique les termes d'interaction de `lotka_volterra_with_payoff`
+    sur un pas de durée `dt`, puis les deux espèces diffusent vers les cellules
+    voisines (bords périodiques) :
+        - "stencil" : laplacien explicite à 5 points (stable si dt * D <= 0.25) ;
+        - "fft" : pas implicite du même laplacien résolu par transformée de
+          Fourier, stable pour tout dt.
+
+    La matrice des payoffs par cellule n'est pas cumulée à chaque pas : seuls les
+    cumuls des proies, des prédateurs et de leur produit sont tenus à jour, et le
+    champ (size, size, 2, 2) n'est calculé qu'à l'appel de `payoff_field()`.
+
+    Parameters:
+        alpha (float): Taux de croissance des proies.
+        beta (float): Taux de prédation.
+        delta (float): Taux de reproduction des prédateurs.
+        gamma (float): Taux de mortalité des prédateurs.
+        prey_init (float or ndarray): Population initiale des proies (uniforme ou par cellule).
+        predator_init (float or ndarray): Population initiale des prédateurs.
+        steps (int): Nombre de pas de temps.
+        size (int): Côté de la grille (ignoré si les populations initiales sont des grilles).
+        dt (float): Durée d'un pas de temps.
+        prey_diffusion (float): Coefficient de diffusion des proies.
+        predator_diffusion (float): Coefficient de diffusion des prédateurs.
+        method (str): Schéma de diffusion, parmi DIFFUSION_METHODS.
+        perturbation (float): Bruit relatif ajouté aux populations initiales uniformes.
+        payoff_every (int): Cumuler les payoffs un pas sur `payoff_every` (pondéré d'autant).
+        rng (int or np.random.Generator, optional): Graine ou générateur aléatoire, voir `make_rng`.
+
+    Returns:
+        prey (ndarray): Population finale des proies dans chaque cellule.
+        predator (ndarray): Population finale des prédateurs dans chaque cellule.
+        mean_history (ndarray): Populations moyennes sur la grille, de forme (2, steps + 1).
+        payoff_field (callable): Renvoie à la demande le champ des matrices de
+            payoffs, de forme (size, size, 2, 2).
+    """
+    if method not in DIFFUSION_METHODS:
+        raise ValueError(f"Méthode de diffusion inconnue : {method} (attendu : {DIFFUSION_METHODS}).")
+    rng = make_rng(rng)
+
+    shape = np.shape(prey_init) or np.shape(predator_init) or (size, size)
+    prey = np.array(np.broadcast_to(prey_init, shape), dtype=np.float64)
+    predator = np.array(np.broadcast_to(predator_init, shape), dtype=np.float64)
+    if np.ndim(prey_init) == 0:
+        prey *= 1 + perturbation * rng.standard_normal(shape)
+    if np.ndim(predator_init) == 0:
+        predator *= 1 + perturbation * rng.standard_normal(shape)
+
+    mean_history = np.empty((2, steps + 1))
+    mean_history[:, 0] = prey.mean(), predator.mean()
+
+    # Cumuls nécessaires au champ des payoffs
+    prey_total = np.zeros(shape)
+    predator_total = np.zeros(shape)
+    predation_total = np.zeros(shape)
+
+    if method == "fft":
+        eigenvalues = _laplacian_eigenvalues(shape)
+        prey_filter = 1 / (1 - dt * prey_diffusion * eigenvalues)
+        predator_filter = 1 / (1 - dt * predator_diffusion * eigenvalues)
+
+    for step in range(steps):
+        # Termes d'interaction de chaque cellule
+        predation = prey * predator
+        prey_change = alpha * prey - beta * predation
+        predator_change = delta * predation - gamma * predator
+        prey += dt * prey_change
+        predator += dt * predator_change
+
+        # Diffusion entre cellules voisines
+        if method == "stencil":
+            prey += dt * prey_diffusion * _laplacian(prey)
+            predator += dt * predator_diffusion * _laplacian(predator)
+        else:
+            prey = np.fft.irfft2(np.fft.rfft2(prey) * prey_filter, s=shape)
+            predator = np.fft.irfft2(np.fft.rfft2(predator) * predator_filter, s=shape)
+        np.maximum(prey, 0, out=prey)
+        np.maximum(predator, 0, out=predator)
+
+        if (step + 1) % payoff_every == 0:
+            prey_total += prey
+            predator_total += predator
+            predation_total += prey * predator
+
+        mean_history[:, step + 1] = prey.mean(), predator.mean()
+
+    def payoff_field():
+        # Mêmes termes que la matrice de lotka_volterra_with_payoff, par cellule et pondérés par dt
+        weight = dt * payoff_every
+        field = np.empty(shape + (2, 2))
+        field[..., 0, 0] = weight * alpha * prey_total
+        field[..., 0, 1] = weight * -beta * predation_total
+        field[..., 1, 0] = weight * delta * predation_total
+        field[..., 1, 1] = weight * -gamma * predator_total
+        return field
+
+    return prey, predator, mean_history, payoff_field
@@ -0,0 +1,150 @@
+import cProfile
+import pstats
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+
+class PhaseProfiler:
+    """
+    Chronomètres par phase des simulations.
+
+    Une simulation qui reçoit un `PhaseProfiler` appelle `start` avec son nom,
+    puis `lap` à la fin de chaque phase de sa boucle : le temps écoulé depuis le
+    tour précédent est attribué à la phase. Sans profiler, les simulations ne
+    font qu'un test `is not None` par phase.
+
+    Avec `allocations=True`, les octets alloués pendant chaque phase (variation
+    nette et pic, suivis par tracemalloc) sont aussi comptés ; le suivi ralentit
+    nettement les simulations, les temps mesurés sont alors surestimés.
+
+    Parameters:
+        allocations (bool): Compte les allocations mémoire de chaque phase.
+    """
+
+    def __init__(self, allocations=False):
+        self.allocations = allocations
+        self.times = {}
+        self.calls = {}
+        self.allocated = {}
+        self.peaks = {}
+        self._scope = None
+        self._clock = None
+        self._memory = 0
+        self._tracing = False
+
+    def __enter__(self):
+        if self.allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._tracing = True
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._tracing:
+            tracemalloc.stop()
+            self._tracing = False
+
+    def start(self, scope):
+        """
+        Démarre le chronomètre d'une simulation.
+
+        Parameters:
+            scope (str): Nom de la simulation, préfixe de ses phases.
+        """
+        self._scope = scope
+        if self.allocations and tracemalloc.is_tracing():
+            self._memory = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        self._clock = time.perf_counter()
+
+    def lap(self, phase):
+        """
+        Attribue à `phase` le temps (et les allocations) écoulé depuis le tour précédent.
+
+        Parameters:
+            phase (str): Nom de la phase qui vient de se terminer.
+        """
+        now = time.perf_counter()
+        key = (self._scope, phase)
+        self.times[key] = self.times.get(key, 0.0) + now - self._clock
+        self.calls[key] = self.calls.get(key, 0) + 1
+        if self.allocations and tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            self.allocated[key] = self.allocated.get(key, 0) + current - self._memory
+            self.peaks[key] = max(self.peaks.get(key, 0), peak - self._memory)
+            self._memory = current
+            tracemalloc.reset_peak()
+        # Le temps passé à compter les allocations n'est attribué à aucune phase
+        self._clock = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name, scope="main"):
+        """
+        Chronomètre un bloc hors des simulations (tracé des graphiques, export...).
+
+        Parameters:
+            name (str): Nom de la phase.
+            scope (str): Nom du groupe de phases.
+        """
+        previous = self._scope
+        self.start(scope)
+        try:
+            yield self
+        finally:
+            self.lap(name)
+            self._scope = previous
+
+    def report(self):
+        """
+        Tableau des phases : appels, temps total, part du temps de la simulation et allocations.
+
+        Returns:
+            report (str): Une ligne par phase, dans l'ordre de première exécution.
+        """
+        totals = {}
+        for (scope, _), elapsed in self.times.items():
+            totals[scope] = totals.get(scope, 0.0) + elapsed
+        lines = [f"{'phase':<40} {'appels':>8} {'temps (s)':>11} {'part':>6}"
+                 + (f" {'alloué (o)':>12} {'pic (o)':>12}" if self.allocated else "")]
+        for key, elapsed in self.times.items():
+            scope, phase = key
+            line = (f"{scope + '.' + phase:<40} {self.calls[key]:>8} {elapsed:>11.3e} "
+                    f"{elapsed / totals[scope] if totals[scope] else 0.0:>6.1%}")
+            if self.allocated:
+                line += f" {self.allocated.get(key, 0):>12} {self.peaks.get(key, 0):>12}"
+            lines.append(line)
+        return "\n".join(lines)
+
+    def collapsed(self):
+        """
+        Phases au format « piles repliées » des flamegraphs (flamegraph.pl, speedscope).
+
+        Returns:
+            lines (list): Lignes « simulation;phase microsecondes ».
+        """
+        return [f"{scope};{phase} {round(elapsed * 1e6)}" for (scope, phase), elapsed in self.times.items()]
+
+    def dump_collapsed(self, path):
+        """Écrit les phases au format « piles repliées » dans le fichier `path`."""
+        with open(path, "w") as output:
+            output.write("\n".join(self.collapsed()) + "\n")
+
+
+def profile_call(func, *args, path=None, **kwargs):
+    """
+    Exécute une simulation sous cProfile, fonction par fonction.
+
+    Parameters:
+        func (callable): Simulation.
+        path (str, optional): Fichier .prof où écrire le profil (lisible par
+            pstats, snakeviz ou flameprof).
+
+    Returns:
+        result (object): Résultat de la simulation.
+        stats (pstats.Stats): Statistiques par fonction.
+    """
+    profiler = cProfile.Profile()
+    result = profiler.runcall(func, *args, **kwargs)
+    if path is not None:
+        profiler.dump_stats(path)
+    return result, pstats.Stats(profiler)
@@ -0,0 +1,103 @@
+import numpy as np
+
+
+def make_rng(seed=None):
+    """
+    Construit le générateur aléatoire d'une simulation.
+
+    Parameters:
+        seed (int, np.random.SeedSequence, np.random.Generator, optional): Graine,
+            séquence de graines ou générateur déjà construit (renvoyé tel quel).
+            Sans graine, le générateur est initialisé par l'entropie du système.
+
+    Returns:
+        rng (np.random.Generator): Générateur aléatoire.
+    """
+    if isinstance(seed, np.random.Generator):
+        return seed
+    return np.random.default_rng(seed)
+
+
+def root_entropy(seed=None):
+    """
+    Renvoie l'entropie d'une graine, à enregistrer pour pouvoir rejouer un calcul.
+
+    Parameters:
+        seed (int, optional): Graine (tirée au hasard si absente).
+
+    Returns:
+        entropy (int): Entropie de la séquence de graines racine.
+    """
+    if isinstance(seed, np.random.SeedSequence):
+        return seed.entropy
+    return np.random.SeedSequence(seed).entropy
+
+
+def task_seed(entropy, index):
+    """
+    Dérive la séquence de graines propre à une tâche d'un calcul parallèle.
+
+    Le flux d'une tâche ne dépend que de l'entropie racine et de l'indice de la
+    tâche, identique à l'enfant `index` de `SeedSequence(entropy).spawn` : les
+    résultats sont les mêmes quel que soit le nombre de processus ou l'ordre
+    d'exécution des tâches.
+
+    Parameters:
+        entropy (int): Entropie racine, voir `root_entropy`.
+        index (int): Indice de la tâche.
+
+    Returns:
+        seed (np.random.SeedSequence): Séquence de graines de la tâche.
+    """
+    return np.random.SeedSequence(entropy, spawn_key=(int(index),))
+
+
+def spawn_rngs(seed, count):
+    """
+    Crée `count` générateurs indépendants à partir d'une même graine.
+
+    Parameters:
+        seed (int, optional): Graine racine.
+        count (int): Nombre de générateurs.
+
+    Returns:
+        rngs (list): Générateurs np.random.Generator indépendants.
+    """
+    entropy = root_entropy(seed)
+    return [np.random.default_rng(task_seed(entropy, index)) for index in range(count)]
+
+
+def _run_task(func, task, seed):
+    """Exécute une tâche avec son propre générateur (fonction de module, transmissible aux processus)."""
+    return func(*task, rng=np.random.default_rng(seed))
+
+
+def parallel_map(func, tasks, seed=None, workers=None):
+    """
+    Exécute `func(*task, rng=...)` pour chaque tâche sur un pool de processus.
+
+    Chaque tâche reçoit son propre générateur, dérivé de `seed` et de son
+    indice : pour une graine donnée, les résultats sont identiques bit à bit
+    quel que soit le nombre de processus.
+
+    Parameters:
+        func (callable): Simulation acceptant un argument nommé `rng`.
+        tasks (list): Arguments positionnels de chaque tâche.
+        seed (int, optional): Graine racine.
+        workers (int, optional): Nombre de processus (1 pour tout exécuter
+            dans le processus courant, par défaut le nombre de cœurs).
+
+    Returns:
+        results (list): Résultats des tâches, dans l'ordre de `tasks`.
+    """
+    tasks = [tuple(task) for task in tasks]
+    entropy = root_entropy(seed)
+    seeds = [task_seed(entropy, index) for index in range(len(tasks))]
+
+    if workers == 1:
+        return [_run_task(func, task, task_seed_) for task, task_seed_ in zip(tasks, seeds)]
+    # Importé ici : concurrent.futures alourdit l'import du module
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_run_task, [func] * len(tasks), tasks, seeds))
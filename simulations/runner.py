@@ -0,0 +1,144 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class SimulationCancelled(Exception):
+    """Levée dans une simulation dont l'exécution a été annulée."""
+
+
+class SimulationJob:
+    """
+    Simulation soumise à un `SimulationRunner`.
+
+    La simulation reçoit `report` comme argument `progress` : elle l'appelle
+    après chaque génération, ce qui met à jour l'avancement et interrompt la
+    simulation (par `SimulationCancelled`) si elle a été annulée.
+
+    Attributes:
+        progress (tuple): Dernier avancement signalé (pas effectués, pas prévus).
+    """
+
+    def __init__(self):
+        self.progress = (0, 0)
+        self._cancel = threading.Event()
+        self._future = None
+        self._reported = None
+
+    def report(self, done, total):
+        """Enregistre l'avancement de la simulation (appelée depuis le fil de calcul)."""
+        if self._cancel.is_set():
+            raise SimulationCancelled()
+        self.progress = (done, total)
+
+    def cancel(self):
+        """Annule la simulation, qu'elle soit en attente ou en cours."""
+        self._cancel.set()
+        self._future.cancel()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    @property
+    def done(self):
+        return self._future.done()
+
+    def result(self, timeout=None):
+        """
+        Résultat de la simulation.
+
+        Raises:
+            SimulationCancelled: Si la simulation a été annulée.
+        """
+        if self._future.cancelled():
+            raise SimulationCancelled()
+        return self._future.result(timeout)
+
+
+class SimulationRunner:
+    """
+    Exécute des simulations en arrière-plan sans bloquer une interface graphique.
+
+    Les simulations tournent sur un pool de fils d'exécution, plusieurs à la
+    fois. L'interface appelle régulièrement `poll` (voir `attach` pour Tk) :
+    les fonctions de suivi sont alors appelées depuis le fil de l'interface.
+
+    Parameters:
+        workers (int): Nombre de simulations exécutées en même temps.
+    """
+
+    def __init__(self, workers=2):
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+        self._jobs = {}
+
+    @property
+    def jobs(self):
+        """Simulations en attente ou en cours."""
+        return list(self._jobs)
+
+    def submit(self, func, *args, on_progress=None, on_done=None, **kwargs):
+        """
+        Soumet une simulation acceptant un argument nommé `progress`.
+
+        Parameters:
+            func (callable): Simulation, appelée avec `*args`, `**kwargs` et `progress`.
+            on_progress (callable, optional): Appelée avec la simulation lorsque
+                son avancement a changé.
+            on_done (callable, optional): Appelée avec la simulation lorsqu'elle est
+                terminée, annulée ou en erreur (voir `SimulationJob.result`).
+
+        Returns:
+            job (SimulationJob): Simulation soumise.
+        """
+        job = SimulationJob()
+        job._future = self._executor.submit(func, *args, progress=job.report, **kwargs)
+        self._jobs[job] = (on_progress, on_done)
+        return job
+
+    def poll(self):
+        """Transmet l'avancement et la fin des simulations ; à appeler depuis le fil de l'interface."""
+        for job, (on_progress, on_done) in list(self._jobs.items()):
+            if job.progress != job._reported:
+                job._reported = job.progress
+                if on_progress is not None:
+                    on_progress(job)
+            if job.done:
+                del self._jobs[job]
+                if on_done is not None:
+                    on_done(job)
+
+    def attach(self, widget, interval=50):
+        """
+        Appelle `poll` toutes les `interval` millisecondes dans la boucle d'événements Tk.
+
+        Parameters:
+            widget (tk.Misc): Fenêtre ou widget Tk.
+            interval (int): Période en millisecondes.
+        """
+        def tick():
+            try:
+                self.poll()
+            finally:
+                # Une erreur dans une fonction de suivi ne doit pas arrêter le suivi des autres simulations
+                widget.after(interval, tick)
+
+        widget.after(interval, tick)
+
+    def cancel_all(self):
+        """Annule toutes les simulations en attente ou en cours."""
+        for job in self._jobs:
+            job.cancel()
+
+    def status(self):
+        """Résumé de l'avancement des simulations, à afficher dans l'interface."""
+        if not self._jobs:
+            return "Aucune simulation en cours"
+        percents = [f"{100 * done // total} %" if total else "en attente" for done, total in
+                    (job.progress for job in self._jobs)]
+        return f"Simulations en cours : {', '.join(percents)}"
+
+    def shutdown(self, cancel=True):
+        """Arrête le pool, en annulant d'abord les simulations si `cancel` est vrai."""
+        if cancel:
+            self.cancel_all()
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,97 @@
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from simulations import cache as cache_module
+from simulations.cache import ResultCache, cache_key
+from simulations.hawk_dove import hawk_dove_game
+from simulations.predator_prey import lotka_volterra_adaptive
+
+
+def test_adaptive_result_is_reused(tmp_path):
+    # Le dictionnaire d'évènements contient None, des listes, des tuples et des entiers
+    cache = ResultCache(str(tmp_path))
+    results = [cache.call(lotka_volterra_adaptive, 0.1, 0.02, 0.01, 0.1, 40, 9, 200.0) for _ in range(3)]
+    assert (cache.hits, cache.misses) == (2, 1)
+    for first, second in zip(results[0][:4], results[2][:4]):
+        assert np.array_equal(first, second)
+    assert results[0][4] == results[2][4]
+
+
+def test_numbers_are_keyed_by_value():
+    assert cache_key(hawk_dove_game, 2, 3, rng=0) == cache_key(hawk_dove_game, 2.0, 3.0, rng=0)
+    assert cache_key(hawk_dove_game, 2, 3, rng=0) != cache_key(hawk_dove_game, 2.5, 3.0, rng=0)
+
+
+def test_unreadable_result_is_removed(tmp_path, caplog):
+    cache = ResultCache(str(tmp_path))
+    cache.put("cle", {"valeurs": np.arange(3)})
+    (tmp_path / "cle.npz").write_bytes(b"illisible")
+    assert cache.get("cle") is None
+    assert not (tmp_path / "cle.npz").exists()
+    assert "illisible" in caplog.text
+
+
+def test_object_results_are_not_stored(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    result = cache.call(lambda rng=0: np.array([object()]), rng=0)
+    assert result.dtype == object
+    assert cache.size() == 0
+
+
+def test_code_version_covers_every_package_module(tmp_path, monkeypatch):
+    # Les simulations du paquet partagent une empreinte qui dépend de tous ses modules
+    assert cache_module.code_version(hawk_dove_game) == cache_module.code_version(lotka_volterra_adaptive)
+    package = tmp_path / "simulations"
+    shutil.copytree(os.path.dirname(cache_module.__file__), package, ignore=shutil.ignore_patterns("__pycache__"))
+    monkeypatch.setattr(cache_module, "_PACKAGE_DIR", str(package))
+    monkeypatch.setattr(cache_module, "_code_versions", {})
+    before = cache_module.code_version(hawk_dove_game)
+    with open(package / "convergence.py", "a") as source:
+        source.write("\n# Modification d'un module importé par hawk_dove\n")
+    monkeypatch.setattr(cache_module, "_code_versions", {})
+    assert cache_module.code_version(hawk_dove_game) != before
+
+
+def test_least_recently_used_results_are_evicted(tmp_path):
+    rng = np.random.default_rng(0)
+    results = ResultCache(str(tmp_path), max_bytes=1 << 40)
+    for key in ("a", "b"):
+        results.put(key, rng.random(1000))  # Incompressible : environ 8 ko par résultat
+    entry_size = results.size() / 2
+    now = time.time()
+    os.utime(tmp_path / "a.npz", (now - 200, now - 200))
+    os.utime(tmp_path / "b.npz", (now - 100, now - 100))
+    assert results.get("a") is not None  # "a" devient le plus récemment utilisé
+    results.max_bytes = int(2.5 * entry_size)
+    results.put("c", rng.random(1000))
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["a.npz", "c.npz"]
+    assert results.size() <= results.max_bytes
+
+
+def write_and_read(directory, worker):
+    # Écritures concurrentes d'une même clé et de clés propres à chaque processus
+    results = ResultCache(directory)
+    values = np.full(5000, float(worker))
+    for repeat in range(20):
+        results.put("commune", {"values": values})
+        results.put(f"propre-{worker}-{repeat}", values)
+        shared = results.get("commune")
+        if shared is None or shared["values"].shape != (5000,) or len(np.unique(shared["values"])) != 1:
+            return False
+    return True
+
+
+def test_concurrent_writers(tmp_path):
+    workers = 4
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        assert all(executor.map(write_and_read, [str(tmp_path)] * workers, range(workers)))
+    results = ResultCache(str(tmp_path))
+    assert results.get("commune")["values"][0] in range(workers)
+    for worker in range(workers):
+        for repeat in range(20):
+            assert np.array_equal(results.get(f"propre-{worker}-{repeat}"), np.full(5000, float(worker)))
+    assert not list(tmp_path.glob("*.tmp"))
@@ -0,0 +1,57 @@
+import numpy as np
+
+from simulations.convergence import ConvergenceMonitor
+from simulations.hawk_dove import hawk_dove_game, hawk_dove_game_batch
+from simulations.jackdaw import multi_role_game
+
+
+def test_converged_at_records_end_of_window():
+    monitor = ConvergenceMonitor(window=5, tol=1e-6)
+    # Réplicat 0 constant, réplicat 1 oscillant
+    keeps = [monitor.update([0.5, step % 2], step=step) for step in range(1, 6)]
+    assert all(keep.all() for keep in keeps[:4])
+    assert np.array_equal(keeps[4], [False, True])
+    for step in range(6, 11):
+        assert monitor.update([step % 2], step=step).all()
+    assert np.array_equal(monitor.converged_at, [5, -1])
+    assert np.array_equal(monitor.index, [1])
+    assert monitor.steps == 10 and not monitor.done
+
+
+def test_batch_freezes_converged_replicates():
+    # V > C : chaque réplicat se fixe sur les Aigles puis reste constant
+    monitor = ConvergenceMonitor(window=10, tol=0.0)
+    history, _ = hawk_dove_game_batch(4.0, 2.0, 200, 300, 20, rng=0, update="wright-fisher", monitor=monitor)
+    assert monitor.done
+    for replicate, step in enumerate(monitor.converged_at):
+        assert 0 < step < 300
+        assert np.all(history[replicate, step:] == history[replicate, step])
+
+
+def test_multi_role_game_stops_early():
+    # Gains nuls : les proportions ne bougent pas et convergent à la fin de la première fenêtre
+    zeros = [np.zeros((2, 3)), np.zeros((2, 3))]
+    rng = np.random.default_rng(0)
+    monitor = ConvergenceMonitor(window=5, tol=0.0)
+    proportions = multi_role_game(zeros, simulations=4, iterations=100, rng=rng, monitor=monitor)
+    assert monitor.done
+    assert np.array_equal(monitor.converged_at, [5] * 4)
+    # Cinq tirages de (simulations, rôles) uniformes seulement, avant l'arrêt
+    reference = np.random.default_rng(0)
+    reference.random(5 * 4 * 2)
+    assert rng.random() == reference.random()
+    assert np.allclose(proportions[0], 0.5) and np.allclose(proportions[1], 1 / 3)
+
+
+def test_monitor_reused_across_runs():
+    monitor = ConvergenceMonitor(window=10, tol=0.0)
+    hawk_dove_game_batch(4.0, 2.0, 200, 300, 20, rng=0, update="wright-fisher", monitor=monitor)
+    history, _ = hawk_dove_game_batch(4.0, 2.0, 200, 300, 7, rng=1, update="wright-fisher", monitor=monitor)
+    fresh = ConvergenceMonitor(window=10, tol=0.0)
+    expected, _ = hawk_dove_game_batch(4.0, 2.0, 200, 300, 7, rng=1, update="wright-fisher", monitor=fresh)
+    assert np.array_equal(history, expected)
+    assert np.array_equal(monitor.converged_at, fresh.converged_at)
+
+    history, _ = hawk_dove_game(4.0, 2.0, 100, 200, rng=2, monitor=monitor)
+    expected, _ = hawk_dove_game(4.0, 2.0, 100, 200, rng=2, monitor=ConvergenceMonitor(window=10, tol=0.0))
+    assert history == expected
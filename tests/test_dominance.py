@@ -0,0 +1,241 @@
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+from simulations import dominance
+from simulations.dominance import (EVENT_DTYPE, DominanceRanking, EventRecorder, InteractionMatrix, LivingIndex,
+                                   davids_scores, dominance_ranks, landau_h, social_dominance_rounds,
+                                   social_dominance_simulation, triangle_transitivity)
+
+
+def random_interactions(population_size, fights, seed):
+    """Combats au hasard : matrice creuse et matrice dense W[i, j] des victoires de i sur j."""
+    rng = np.random.default_rng(seed)
+    winners = rng.integers(0, population_size, fights)
+    losers = (winners + rng.integers(1, population_size, fights)) % population_size
+    interactions = InteractionMatrix(population_size, buffer_size=16)
+    half = fights // 2
+    for winner, loser in zip(winners[:half], losers[:half]):
+        interactions.record(winner, loser)
+    interactions.record_many(winners[half:], losers[half:])
+    wins = np.zeros((population_size, population_size), dtype=np.int64)
+    np.add.at(wins, (winners, losers), 1)
+    return interactions, wins
+
+
+CASES = [(2, 3, 0), (5, 4, 1), (8, 30, 2), (12, 40, 3), (15, 400, 4), (30, 200, 5)]
+
+
+@pytest.mark.parametrize("population_size, fights, seed", CASES)
+def test_pairs_match_dense_matrix(population_size, fights, seed):
+    interactions, wins = random_interactions(population_size, fights, seed)
+    dense = np.zeros_like(wins)
+    winners, losers, pair_wins = interactions.pairs()
+    dense[winners, losers] = pair_wins
+    assert np.array_equal(dense, wins)
+
+
+@pytest.mark.parametrize("corrected", [False, True])
+@pytest.mark.parametrize("population_size, fights, seed", CASES)
+def test_davids_scores_match_dense(population_size, fights, seed, corrected):
+    interactions, wins = random_interactions(population_size, fights, seed)
+    fights_per_dyad = wins + wins.T
+    with np.errstate(invalid="ignore"):
+        p = np.where(fights_per_dyad > 0, wins / fights_per_dyad, 0.0)
+    if corrected:
+        p = np.where(fights_per_dyad > 0, p - (p - 0.5) / (fights_per_dyad + 1), 0.0)
+    w, l = p.sum(axis=1), p.sum(axis=0)
+    expected = w + p @ w - l - p.T @ l
+    assert np.allclose(davids_scores(interactions, corrected=corrected), expected)
+
+
+@pytest.mark.parametrize("improved", [False, True])
+@pytest.mark.parametrize("population_size, fights, seed", CASES)
+def test_landau_h_matches_dense(population_size, fights, seed, improved):
+    interactions, wins = random_interactions(population_size, fights, seed)
+    n = population_size
+    # Dyade dominée : 1 ; égalité ou jamais affrontée : 1/2 à chacun
+    dominates = np.where(wins > wins.T, 1.0, np.where(wins == wins.T, 0.5, 0.0))
+    np.fill_diagonal(dominates, 0)
+    expected = 12 / (n ** 3 - n) * np.sum((dominates.sum(axis=1) - (n - 1) / 2) ** 2)
+    if improved:
+        unknown = np.count_nonzero(np.triu(wins == wins.T, 1))
+        expected += 6 * unknown / (n ** 3 - n)
+    assert landau_h(interactions, improved=improved) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("wedge_batch", [1, 7, 1 << 22])
+@pytest.mark.parametrize("population_size, fights, seed", CASES)
+def test_triangle_transitivity_matches_enumeration(population_size, fights, seed, wedge_batch):
+    interactions, wins = random_interactions(population_size, fights, seed)
+    transitive = cyclic = 0
+    for a, b, c in combinations(range(population_size), 3):
+        dyads = [(a, b), (b, c), (a, c)]
+        if any(wins[i, j] == wins[j, i] for i, j in dyads):
+            continue
+        ab, bc, ac = (wins[i, j] > wins[j, i] for i, j in dyads)
+        if (ab and bc and not ac) or (not ab and not bc and ac):
+            cyclic += 1
+        else:
+            transitive += 1
+    result = triangle_transitivity(interactions, wedge_batch=wedge_batch)
+    assert (result["transitive"], result["cyclic"]) == (transitive, cyclic)
+    if transitive + cyclic:
+        assert result["p_t"] == pytest.approx(transitive / (transitive + cyclic))
+    else:
+        assert np.isnan(result["p_t"])
+
+
+def test_subset_matches_dense():
+    interactions, wins = random_interactions(20, 150, 6)
+    keep = np.random.default_rng(6).random(20) < 0.6
+    winners, losers, pair_wins = interactions.subset(keep).pairs()
+    dense = np.zeros((keep.sum(), keep.sum()), dtype=np.int64)
+    dense[winners, losers] = pair_wins
+    assert np.array_equal(dense, wins[np.ix_(keep, keep)])
+
+
+def brute_force_ranks(fighting_ability, alive, death_order):
+    # Boucle d'origine : tri des vivants par (capacité décroissante, indice), morts à la fin
+    n = len(fighting_ability)
+    ranks = np.empty(n, dtype=int)
+    living = sorted((i for i in range(n) if alive[i]), key=lambda i: (-fighting_ability[i], i))
+    for rank, i in enumerate(living, start=1):
+        ranks[i] = rank
+    for i in range(n):
+        if not alive[i]:
+            ranks[i] = n - death_order[i] + 1
+    return ranks
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_incremental_ranking_matches_sort(seed):
+    rng = np.random.default_rng(seed)
+    n = 300
+    # Capacités arrondies : des égalités départagées par l'indice
+    fighting_ability = np.round(rng.uniform(0.5, 1.5, n), 2)
+    alive = np.ones(n, dtype=bool)
+    death_order = np.zeros(n, dtype=int)
+    ranking = DominanceRanking(fighting_ability, block_size=8)
+    deaths = 0
+    for step in range(2000):
+        i = rng.choice(np.flatnonzero(alive))
+        if rng.random() < 0.05 and alive.sum() > 1:
+            alive[i] = False
+            deaths += 1
+            death_order[i] = deaths
+            ranking.remove(i)
+        else:
+            fighting_ability[i] = np.round(fighting_ability[i] + rng.normal(0, 0.1), 2)
+            ranking.update(i, fighting_ability[i])
+        if step % 97 == 0:
+            expected = brute_force_ranks(fighting_ability, alive, death_order)
+            assert np.array_equal(ranking.ranks(death_order), expected)
+            assert np.array_equal(dominance_ranks(fighting_ability, alive, death_order), expected)
+    assert len(ranking) == alive.sum()
+
+
+# Seuil de changements : repli sur le tri dès le départ (défaut), au cours de la simulation, ou jamais
+@pytest.mark.parametrize("max_changes", [dominance.INCREMENTAL_MAX_CHANGES, 0.9, 1.0])
+def test_incremental_simulation_matches_sort(monkeypatch, max_changes):
+    monkeypatch.setattr(dominance, "INCREMENTAL_MAX_CHANGES", max_changes)
+    sort = social_dominance_simulation(200, 20, mortality_risk=0.02, rng=7)
+    incremental = social_dominance_simulation(200, 20, mortality_risk=0.02, rng=7, ranking="incremental")
+    for expected, result in zip(sort, incremental):
+        assert np.array_equal(expected, result)
+
+
+def test_simulation_interactions_count_every_fight():
+    interactions = InteractionMatrix(40)
+    dominance_history, _, _ = social_dominance_simulation(40, 5, mortality_risk=0.0, rng=8,
+                                                          interactions=interactions)
+    assert len(dominance_history) == 5
+    _, _, wins = interactions.pairs()
+    assert wins.sum() == 40 * 5
+
+
+def recorded_fights(rng, generation, fights):
+    i = rng.integers(0, 100, fights)
+    opponent = rng.integers(0, 100, fights)
+    return (generation, i, opponent, np.where(rng.random(fights) < 0.5, i, opponent), rng.random(fights),
+            rng.integers(0, 4, fights).astype(np.int8))
+
+
+@pytest.mark.parametrize("capacity", [1, 7, 64])
+def test_event_recorder_wraparound(capacity):
+    rng = np.random.default_rng(capacity)
+    recorder = EventRecorder(capacity)
+    expected = []
+    # Rondes plus courtes et plus longues que le tampon, mêlées de combats isolés
+    for generation, fights in enumerate([3, 0, 10, 1, 6, 150, 2, 7]):
+        batch = recorded_fights(rng, generation, fights)
+        if fights == 1:
+            recorder.record(*(field if np.isscalar(field) else field[0] for field in batch))
+        else:
+            recorder.record_many(*batch)
+        expected += [(generation, *(field[k] for field in batch[1:])) for k in range(fights)]
+        assert recorder.count == len(expected)
+        assert recorder.dropped == max(0, len(expected) - capacity)
+        kept = np.array(expected[len(expected) - min(len(expected), capacity):], dtype=EVENT_DTYPE)
+        assert np.array_equal(recorder.events, kept)
+
+
+def test_event_recorder_save_after_overflow(tmp_path):
+    rng = np.random.default_rng(0)
+    recorder = EventRecorder(16)
+    for generation in range(5):
+        recorder.record_many(*recorded_fights(rng, generation, 7))
+    assert recorder.dropped == 35 - 16
+    recorder.save(str(tmp_path / "combats.npy"))
+    saved = np.load(tmp_path / "combats.npy")
+    assert saved.dtype == EVENT_DTYPE
+    assert np.array_equal(saved, recorder.events)
+    # Les 16 derniers combats : les 2 derniers de la génération 2, puis les générations 3 et 4
+    assert np.array_equal(saved["generation"], [2] * 2 + [3] * 7 + [4] * 7)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_living_index_swap_remove(seed):
+    rng = np.random.default_rng(seed)
+    population_size = 30
+    living = LivingIndex(population_size)
+    alive = np.ones(population_size, dtype=bool)
+    while len(living) > 1:
+        individual = rng.choice(np.flatnonzero(alive))
+        living.remove(individual)
+        alive[individual] = False
+        # `members` est une permutation dont `position` est l'inverse, vivants en tête
+        assert np.array_equal(np.sort(living.members), np.arange(population_size))
+        assert np.array_equal(living.members[living.position], np.arange(population_size))
+        assert np.array_equal(np.sort(living.members[:living.size]), np.flatnonzero(alive))
+        assert np.array_equal(living.snapshot(), np.flatnonzero(alive))
+        assert all((i in living) == alive[i] for i in range(population_size))
+
+
+def test_living_index_sample_other():
+    rng = np.random.default_rng(0)
+    living = LivingIndex(10)
+    for individual in (3, 0, 9, 5):
+        living.remove(individual)
+    survivors = living.snapshot()
+    for individual in survivors:
+        draws = [living.sample_other(individual, rng) for _ in range(600)]
+        others = survivors[survivors != individual]
+        # Jamais soi-même ni un mort, et chaque autre vivant est tiré
+        assert set(draws) == set(others)
+        counts = np.bincount(draws, minlength=10)[others]
+        assert counts.min() > 600 / len(others) / 2
+
+
+@pytest.mark.parametrize("simulation", [social_dominance_simulation, social_dominance_rounds])
+def test_history_files_truncated_on_early_stop(tmp_path, simulation):
+    # Forte mortalité : la population s'éteint bien avant les 200 générations prévues
+    in_memory = simulation(40, 200, mortality_risk=0.05, rng=1)
+    on_disk = simulation(40, 200, mortality_risk=0.05, rng=1, history_dir=str(tmp_path))
+    assert 0 < len(in_memory[0]) < 200
+    for name, expected, result in zip(("dominance", "costs", "abilities"), in_memory, on_disk):
+        saved = np.load(tmp_path / f"{name}.npy")
+        assert saved.dtype == expected.dtype
+        assert np.array_equal(saved, expected) and np.array_equal(result, expected)
+
@@ -0,0 +1,139 @@
+import numpy as np
+import pytest
+
+from simulations.hawk_dove import (NEIGHBOURHOODS, count_pairs, hawk_dove_game_batch, hawk_dove_lattice,
+                                   lattice_payoffs, payoff_matrix_from_counts, selection_weights, strategy_fitness)
+
+
+def brute_force_payoff_matrix(V, C, population):
+    # Double boucle d'origine sur toutes les paires (i < j)
+    population_size = len(population)
+    current_payoffs = np.zeros((2, 2))
+    for i in range(population_size):
+        for j in range(i + 1, population_size):
+            if population[i] == 1 and population[j] == 1:
+                current_payoffs[1, 1] += (V / 2) - (C / 2)
+            elif population[i] == 1:
+                current_payoffs[1, 0] += V
+            elif population[j] == 1:
+                current_payoffs[0, 1] += V
+            else:
+                current_payoffs[0, 0] += V / 2
+    return current_payoffs / (population_size * (population_size - 1) / 2)
+
+
+POPULATIONS = [np.random.default_rng(seed).integers(0, 2, size) for seed, size in enumerate((2, 3, 7, 20, 51))]
+POPULATIONS += [np.ones(10, dtype=int), np.zeros(10, dtype=int)]  # Que des Aigles, que des Colombes
+
+
+@pytest.mark.parametrize("population", POPULATIONS)
+def test_count_pairs_matches_pair_loop(population):
+    hawk_first = sum(population[i] == 1 and population[j] == 0
+                     for i in range(len(population)) for j in range(i + 1, len(population)))
+    assert count_pairs(population) == (int(population.sum()), hawk_first)
+
+
+@pytest.mark.parametrize("V, C", [(2.0, 3.0), (4.0, 2.0), (1.5, 0.7)])
+@pytest.mark.parametrize("population", POPULATIONS)
+def test_payoff_matrix_matches_pair_loop(population, V, C):
+    hawks, hawk_first = count_pairs(population)
+    assert np.allclose(payoff_matrix_from_counts(V, C, hawks, len(population), hawk_first),
+                       brute_force_payoff_matrix(V, C, population))
+
+
+@pytest.mark.parametrize("V, C", [(4.0, 2.0), (10.0, 1.0), (2.0, 4.0), (1.0, 4.0), (2.0, 3.0)])
+def test_fitness_equal_at_mixed_ess(V, C):
+    # En population infinie, les deux stratégies ont la même fitness pour h = V / C
+    population_size = 10**6
+    hawks = round(min(V / C, 1.0) * population_size)
+    dove, hawk = strategy_fitness(V, C, hawks, population_size)
+    if V >= C:
+        assert hawk > dove
+    else:
+        assert hawk == pytest.approx(dove, abs=1e-5)
+
+
+@pytest.mark.parametrize("V, C", [(4.0, 2.0), (2.0, 4.0), (10.0, 1.0), (1.0, 4.0), (2.0, 3.0)])
+def test_birth_probability_moves_towards_ess(V, C):
+    ess = min(V / C, 1.0)
+    for hawk_fraction in (0.1, 0.5, 0.9):
+        if hawk_fraction == ess:
+            continue
+        birth = selection_weights(V, C, round(hawk_fraction * 1000), 1000)
+        assert (birth > hawk_fraction) == (hawk_fraction < ess)
+
+
+@pytest.mark.parametrize("update", ["wright-fisher", "moran"])
+@pytest.mark.parametrize("V, C", [(4.0, 2.0), (10.0, 1.0)])
+def test_hawks_fixate_when_resource_exceeds_cost(V, C, update):
+    history, _ = hawk_dove_game_batch(V, C, 1000, 300, 100, rng=0, update=update)
+    assert np.all(history[:, -1] == 1.0)
+
+
+@pytest.mark.parametrize("update", ["wright-fisher", "moran"])
+@pytest.mark.parametrize("V, C", [(2.0, 4.0), (1.0, 4.0), (2.0, 3.0)])
+def test_mixed_equilibrium_matches_analytic_ess(V, C, update):
+    history, _ = hawk_dove_game_batch(V, C, 1000, 300, 200, rng=0, update=update)
+    assert np.mean(history[:, -1]) == pytest.approx(V / C, abs=0.02)
+
+
+def brute_force_lattice_payoffs(V, C, grid, neighbourhood):
+    payoffs = np.array([[V / 2, 0.0], [V, (V - C) / 2]])
+    rows, cols = grid.shape
+    result = np.zeros(grid.shape)
+    for y in range(rows):
+        for x in range(cols):
+            for dy, dx in NEIGHBOURHOODS[neighbourhood]:
+                result[y, x] += payoffs[grid[y, x], grid[(y + dy) % rows, (x + dx) % cols]]
+    return result
+
+
+@pytest.mark.parametrize("neighbourhood", list(NEIGHBOURHOODS))
+@pytest.mark.parametrize("V, C", [(2.0, 3.0), (4.0, 2.0), (1.0, 1.0)])
+def test_lattice_payoffs_match_brute_force(V, C, neighbourhood):
+    grid = (np.random.default_rng(0).random((7, 9)) < 0.5).astype(np.int8)
+    assert np.allclose(lattice_payoffs(V, C, grid, neighbourhood), brute_force_lattice_payoffs(V, C, grid, neighbourhood))
+
+
+@pytest.mark.parametrize("neighbourhood", list(NEIGHBOURHOODS))
+def test_imitate_best_matches_brute_force(neighbourhood):
+    # Une génération : chaque cellule prend la stratégie du premier meilleur payoff
+    # parmi elle-même puis ses voisins, dans l'ordre de NEIGHBOURHOODS
+    _, grid, _ = hawk_dove_lattice(2.0, 3.0, 12, 3, neighbourhood=neighbourhood, rng=4)
+    _, next_grid, _ = hawk_dove_lattice(2.0, 3.0, 12, 4, neighbourhood=neighbourhood, rng=4)
+    payoffs = brute_force_lattice_payoffs(2.0, 3.0, grid, neighbourhood).astype(np.float32)
+    expected = grid.copy()
+    for y in range(12):
+        for x in range(12):
+            best = payoffs[y, x]
+            for dy, dx in NEIGHBOURHOODS[neighbourhood]:
+                if payoffs[(y + dy) % 12, (x + dx) % 12] > best:
+                    best = payoffs[(y + dy) % 12, (x + dx) % 12]
+                    expected[y, x] = grid[(y + dy) % 12, (x + dx) % 12]
+    assert np.array_equal(next_grid, expected)
+
+
+
+@pytest.mark.parametrize("neighbourhood", list(NEIGHBOURHOODS))
+def test_fermi_matches_brute_force(neighbourhood):
+    # Première génération refaite cellule par cellule avec les mêmes tirages
+    size, noise = 10, 0.5
+    offsets = NEIGHBOURHOODS[neighbourhood]
+    rng = np.random.default_rng(5)
+    grid = (rng.random((size, size)) < 0.5).astype(np.int8)
+    choice = (rng.random(grid.shape) * len(offsets)).astype(np.int8)
+    uniforms = rng.random(grid.shape)
+    payoffs = lattice_payoffs(2.0, 3.0, grid, neighbourhood)
+    model_payoffs = np.empty_like(payoffs)
+    model_strategies = np.empty_like(grid)
+    for y in range(size):
+        for x in range(size):
+            dy, dx = offsets[choice[y, x]]
+            model_payoffs[y, x] = payoffs[(y + dy) % size, (x + dx) % size]
+            model_strategies[y, x] = grid[(y + dy) % size, (x + dx) % size]
+    exponent = np.clip((payoffs - model_payoffs) / np.float32(noise), -50, 50)
+    expected = np.where(uniforms < 1 / (1 + np.exp(exponent)), model_strategies, grid)
+
+    _, result, _ = hawk_dove_lattice(2.0, 3.0, size, 1, neighbourhood=neighbourhood, update="fermi", noise=noise,
+                                     rng=5)
+    assert np.array_equal(result, expected)
@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+
+from simulations.jackdaw import jackdaw_game, multi_role_game
+
+PAYOFFS = [np.array([[5, 2], [3, 4]]), np.array([[5, 3], [2, 4]])]
+
+
+@pytest.mark.parametrize("initial_counts", [
+    [[50, -1], [50, 50]],
+    [[50, np.nan], [50, 50]],
+    [[50, np.inf], [50, 50]],
+    [[0, 0], [50, 50]],
+    [[50, 50, 50], [50, 50]],
+])
+def test_invalid_initial_counts(initial_counts):
+    with pytest.raises(ValueError):
+        multi_role_game(PAYOFFS, initial_counts=initial_counts, simulations=3, iterations=5, rng=0)
+
+
+def test_non_finite_payoffs():
+    with pytest.raises(ValueError):
+        multi_role_game([PAYOFFS[0], np.array([[5.0, np.nan], [2.0, 4.0]])], simulations=3, iterations=5, rng=0)
+
+
+def test_counts_driven_negative_by_payoffs():
+    # Des gains très négatifs vident les comptages en quelques interactions
+    losses = [-np.full((2, 2), 10.0), -np.full((2, 2), 10.0)]
+    with pytest.raises(ValueError, match="interaction"):
+        multi_role_game(losses, initial_counts=[[5.0, 5.0], [5.0, 5.0]], simulations=3, iterations=5, rng=0)
+
+
+def test_negative_payoffs_with_positive_counts():
+    payoffs = [np.array([[1.0, -1.0], [2.0, 1.0]]), np.array([[1.0, 2.0], [-1.0, 1.0]])]
+    proportions = multi_role_game(payoffs, initial_counts=[[50.0, 50.0], [50.0, 50.0]], simulations=4,
+                                  iterations=20, rng=0)
+    for role_proportions in proportions:
+        assert np.allclose(role_proportions.sum(axis=1), 1.0)
+
+
+def test_fractional_payoffs_change_proportions():
+    # Des gains de 0,5 tronqués en comptages entiers laisseraient les proportions à 1/2
+    halves = [np.full((2, 2), 0.5), np.full((2, 2), 0.5)]
+    for initial_counts in (None, [[50, 50], [50, 50]]):
+        proportions = multi_role_game(halves, initial_counts=initial_counts, simulations=20, iterations=10, rng=0)
+        for role_proportions in proportions:
+            assert not np.allclose(role_proportions, 0.5)
+            assert np.allclose(role_proportions.sum(axis=1), 1.0)
+
+
+def test_jackdaw_proportions():
+    history = jackdaw_game(simulations=10, iterations=20, rng=0)
+    assert np.allclose(history["male_consolation"] + history["male_avoidance"], 1.0)
+    assert np.allclose(history["female_signal"] + history["female_neutral"], 1.0)
+
+
+def brute_force_multi_role(payoff_tensors, initial_counts, simulations, iterations, rng):
+    # Une simulation et un rôle à la fois, avec le même tirage uniforme que le moteur vectorisé
+    counts = [[np.array(role_counts, dtype=float) for role_counts in initial_counts] for _ in range(simulations)]
+    for _ in range(iterations):
+        uniforms = rng.random((simulations, len(initial_counts)))
+        for simulation in range(simulations):
+            choices = []
+            for role, role_counts in enumerate(counts[simulation]):
+                cdf = np.cumsum(role_counts / role_counts.sum())
+                choices.append(int(np.searchsorted(cdf[:-1], uniforms[simulation, role], side="right")))
+            for role, tensor in enumerate(payoff_tensors):
+                counts[simulation][role][choices[role]] += tensor[tuple(choices)]
+    return [np.array([simulation_counts[role] / simulation_counts[role].sum() for simulation_counts in counts])
+            for role in range(len(initial_counts))]
+
+
+@pytest.mark.parametrize("shape", [(2, 2), (3, 4), (2, 3, 5), (6,)])
+def test_multi_role_matches_brute_force(shape):
+    rng = np.random.default_rng(sum(shape))
+    payoff_tensors = [rng.uniform(0, 5, shape) for _ in shape]
+    initial_counts = [rng.uniform(1, 50, strategies) for strategies in shape]
+    expected = brute_force_multi_role(payoff_tensors, initial_counts, 7, 30, np.random.default_rng(1))
+    result = multi_role_game(payoff_tensors, initial_counts=initial_counts, simulations=7, iterations=30, rng=1)
+    for role_expected, role_result in zip(expected, result):
+        assert np.allclose(role_result, role_expected)
+
+
+def test_jackdaw_is_two_role_case():
+    history = jackdaw_game(simulations=20, iterations=30, rng=3)
+    male, female = multi_role_game(PAYOFFS, initial_counts=[[50, 50], [50, 50]], simulations=20, iterations=30, rng=3)
+    assert np.array_equal(history["male_consolation"], male[:, 0])
+    assert np.array_equal(history["female_neutral"], female[:, 1])
@@ -0,0 +1,145 @@
+import numpy as np
+import pytest
+
+from simulations.predator_prey import (DIFFUSION_METHODS, STOCHASTIC_METHODS, iter_lotka_volterra,
+                                       lotka_volterra_adaptive, lotka_volterra_diffusion, lotka_volterra_ensemble,
+                                       lotka_volterra_stochastic, lotka_volterra_to_npy, lotka_volterra_with_payoff)
+
+PARAMETERS = (0.1, 0.02, 0.01, 0.1)
+
+
+@pytest.mark.parametrize("prey_init, predator_init, species", [(0.0, 9.0, "prey"), (40.0, 0.0, "predator"),
+                                                                (40.0, 1e-7, "predator")])
+def test_extinct_at_start(prey_init, predator_init, species):
+    times, prey, predators, payoff_matrix, events = lotka_volterra_adaptive(*PARAMETERS, prey_init, predator_init,
+                                                                            200.0)
+    assert events["extinction"] == (0.0, species)
+    assert times.tolist() == [0.0]
+    assert (prey[0], predators[0]) == (prey_init, predator_init)
+    assert not payoff_matrix.any()
+
+
+def test_extinction_during_integration():
+    # Presque pas de proies : les prédateurs s'éteignent avant leur retour
+    times, _, predators, _, events = lotka_volterra_adaptive(*PARAMETERS, 1e-3, 50.0, 500.0)
+    instant, species = events["extinction"]
+    assert species == "predator"
+    assert 0 < instant == times[-1] < 500.0
+    assert predators[-1] == pytest.approx(1e-6)
+
+
+def test_cycle_without_extinction():
+    times, prey, _, _, events = lotka_volterra_adaptive(*PARAMETERS, 40, 9, 200.0)
+    assert events["extinction"] is None
+    assert times[-1] == pytest.approx(200.0)
+    assert np.all(prey > 0)
+    assert len(events["crossings"]) >= 2
+
+
+def random_members(count, seed):
+    rng = np.random.default_rng(seed)
+    return (rng.uniform(0.05, 0.2, count), rng.uniform(0.01, 0.03, count), rng.uniform(0.005, 0.02, count),
+            rng.uniform(0.05, 0.2, count), rng.uniform(1, 60, count), rng.uniform(1, 20, count))
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_ensemble_matches_scalar(seed):
+    members = random_members(6, seed)
+    # Un membre qui s'éteint, pour vérifier la troncature à 0
+    members[0][0], members[1][0], members[4][0], members[5][0] = 2.0, 1.0, 50.0, 30.0
+    prey_history, predator_history, payoff_matrices = lotka_volterra_ensemble(*members, 300)
+    for member, parameters in enumerate(zip(*members)):
+        prey, predators, payoff_matrix = lotka_volterra_with_payoff(*parameters, 300)
+        assert np.array_equal(prey_history[member], prey)
+        assert np.array_equal(predator_history[member], predators)
+        assert np.array_equal(payoff_matrices[member], payoff_matrix)
+
+
+def test_ensemble_broadcasts_and_fills_out():
+    out = (np.empty((3, 51)), np.empty((3, 51)), np.full((3, 2, 2), np.nan))
+    result = lotka_volterra_ensemble([0.1, 0.12, 0.15], 0.02, 0.01, 0.1, 40, 9, 50, out=out)
+    assert all(array is buffer for array, buffer in zip(result, out))
+    prey, predators, payoff_matrix = lotka_volterra_with_payoff(0.12, 0.02, 0.01, 0.1, 40, 9, 50)
+    assert np.array_equal(out[0][1], prey)
+    assert np.array_equal(out[2][1], payoff_matrix)
+
+
+@pytest.mark.parametrize("seed", range(3))
+@pytest.mark.parametrize("chunk_size", [1, 5, 64, 4096])
+def test_stream_matches_in_memory(seed, chunk_size):
+    parameters = [values[0] for values in random_members(1, seed)]
+    prey, predators, payoff_matrix = lotka_volterra_with_payoff(*parameters, 1000)
+    blocks = [(prey_block.copy(), predator_block.copy(), payoffs.copy()) for prey_block, predator_block, payoffs in
+              iter_lotka_volterra(*parameters, 1000, chunk_size=max(chunk_size, 2))]
+    assert np.array_equal(np.concatenate([block[0] for block in blocks]), prey)
+    assert np.array_equal(np.concatenate([block[1] for block in blocks]), predators)
+    assert np.array_equal(blocks[-1][2], payoff_matrix)
+
+
+def test_npy_matches_in_memory(tmp_path):
+    prey, predators, payoff_matrix = lotka_volterra_with_payoff(0.1, 0.02, 0.01, 0.1, 40, 9, 777)
+    history, streamed_payoffs = lotka_volterra_to_npy(str(tmp_path / "history.npy"), 0.1, 0.02, 0.01, 0.1, 40, 9,
+                                                      777, chunk_size=100)
+    assert np.array_equal(history, np.array([prey, predators]))
+    assert np.array_equal(streamed_payoffs, payoff_matrix)
+
+
+@pytest.mark.parametrize("method", STOCHASTIC_METHODS)
+def test_stochastic_without_possible_reaction(method):
+    # alpha = 0 et aucun prédateur : aucune réaction, les proies restent constantes jusqu'à t_max
+    with np.errstate(all="raise"):
+        times, prey, predators, events = lotka_volterra_stochastic(0.0, 0.1, 0.075, 1.5, 10, 0, 5.0, replicates=4,
+                                                                   method=method, samples=11,
+                                                                   stop_on_extinction=False, rng=0)
+    assert np.all(prey == 10) and np.all(predators == 0)
+    assert events["events"] == 0
+    assert np.array_equal(events["extinction_times"], [[np.inf, 0.0]] * 4)
+
+
+def test_stochastic_extinction_times():
+    # Sans proies, chaque prédateur meurt au taux gamma : extinction en 1 + 1/2 + ... + 1/5 en moyenne
+    times, prey, predators, events = lotka_volterra_stochastic(1.0, 0.1, 0.075, 1.0, 0, 5, 50.0, replicates=2000,
+                                                               samples=501, stop_on_extinction=False, rng=0)
+    extinction_times = events["extinction_times"]
+    assert np.all(extinction_times[:, 0] == 0.0)
+    assert np.all(np.isfinite(extinction_times[:, 1]))
+    assert extinction_times[:, 1].mean() == pytest.approx(sum(1 / k for k in range(1, 6)), abs=0.1)
+    # Les historiques enregistrés sont cohérents avec les instants d'extinction
+    after = times >= extinction_times[:, 1:]
+    assert np.all(predators[after] == 0) and np.all(predators[~after] > 0)
+    assert np.all(prey == 0)
+
+
+@pytest.mark.parametrize("method", STOCHASTIC_METHODS)
+def test_stochastic_mean_matches_ode(method):
+    # Grandes populations : la moyenne des réplicats suit l'équation différentielle
+    parameters = (1.0, 0.001, 0.0005, 0.5, 1000, 500, 1.0)
+    _, ode_prey, ode_predators, _, _ = lotka_volterra_adaptive(*parameters)
+    _, prey, predators, _ = lotka_volterra_stochastic(*parameters, replicates=40, method=method, tau=0.001,
+                                                      samples=2, rng=0)
+    assert prey[:, -1].mean() == pytest.approx(ode_prey[-1], rel=0.03)
+    assert predators[:, -1].mean() == pytest.approx(ode_predators[-1], rel=0.03)
+
+
+@pytest.mark.parametrize("method", DIFFUSION_METHODS)
+def test_diffusion_conserves_mass(method):
+    # Sans interaction, la diffusion ne fait que répartir les populations entre les cellules
+    grid = np.random.default_rng(0).random((16, 16))
+    prey, predator, mean_history, _ = lotka_volterra_diffusion(0.0, 0.0, 0.0, 0.0, 40 * grid, 9 * grid[::-1], 200,
+                                                               dt=0.5, method=method)
+    assert np.allclose(mean_history[0], 40 * grid.mean(), rtol=1e-12)
+    assert np.allclose(mean_history[1], 9 * grid.mean(), rtol=1e-12)
+    assert prey.std() < 40 * grid.std() / 10 and predator.std() < 9 * grid.std() / 10
+
+
+def test_stencil_and_fft_agree():
+    # Schémas explicite et implicite du même laplacien : écart en O(dt)
+    cells = np.arange(16)
+    grid = 1 + 0.5 * np.outer(np.sin(2 * np.pi * cells / 16), np.cos(4 * np.pi * cells / 16))
+    for dt, tolerance in ((0.01, 2e-4), (0.001, 2e-5)):
+        results = [lotka_volterra_diffusion(*PARAMETERS, 40 * grid, 9 * grid, round(1 / dt), dt=dt, method=method)
+                   for method in DIFFUSION_METHODS]
+        (stencil_prey, stencil_predator, _, _), (fft_prey, fft_predator, _, _) = results
+        assert np.max(np.abs(stencil_prey - fft_prey)) < 40 * tolerance
+        assert np.max(np.abs(stencil_predator - fft_predator)) < 9 * tolerance
+
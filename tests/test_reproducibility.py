@@ -0,0 +1,130 @@
+import numpy as np
+import pytest
+
+from simulations.dominance import social_dominance_rounds, social_dominance_simulation
+from simulations.hawk_dove import (hawk_dove_counts_game, hawk_dove_game, hawk_dove_game_batch, hawk_dove_lattice,
+                                   hawk_dove_sweep)
+from simulations.jackdaw import jackdaw_game, multi_role_game
+from simulations.predator_prey import (iter_lotka_volterra, lotka_volterra_diffusion, lotka_volterra_stochastic,
+                                       lotka_volterra_to_npy, lotka_volterra_with_payoff)
+from simulations.random_streams import parallel_map
+
+SEED = 12345
+
+
+def assert_identical(first, second):
+    """Vérifie que deux résultats (tableaux, tuples, listes, dictionnaires) sont identiques bit à bit."""
+    if isinstance(first, dict):
+        assert first.keys() == second.keys()
+        for key in first:
+            assert_identical(first[key], second[key])
+    elif isinstance(first, (tuple, list)):
+        assert len(first) == len(second)
+        for a, b in zip(first, second):
+            assert_identical(a, b)
+    elif callable(first):
+        # Résultat calculé à la demande (champ des payoffs de lotka_volterra_diffusion)
+        assert_identical(first(), second())
+    else:
+        first, second = np.asarray(first), np.asarray(second)
+        assert first.dtype == second.dtype
+        assert first.shape == second.shape
+        # Comparaison des octets : distingue -0.0 de 0.0 et compare les NaN
+        assert first.tobytes() == second.tobytes()
+
+
+RUNS = {
+    "hawk_dove_game": lambda rng: hawk_dove_game(2.0, 3.0, 200, 20, rng=rng),
+    "hawk_dove_game_batch": lambda rng: hawk_dove_game_batch(2.0, 3.0, 200, 20, 50, rng=rng),
+    "hawk_dove_game_batch_moran": lambda rng: hawk_dove_game_batch(2.0, 3.0, 200, 20, 50, rng=rng, update="moran"),
+    "hawk_dove_counts_game": lambda rng: hawk_dove_counts_game(2.0, 3.0, 200, 20, rng=rng),
+    "hawk_dove_lattice": lambda rng: hawk_dove_lattice(2.0, 3.0, 32, 5, rng=rng),
+    "hawk_dove_lattice_fermi": lambda rng: hawk_dove_lattice(2.0, 3.0, 32, 5, update="fermi", rng=rng),
+    "jackdaw_game": lambda rng: jackdaw_game(200, 20, rng=rng),
+    "multi_role_game": lambda rng: multi_role_game([np.ones((3, 4)), np.ones((3, 4))], simulations=50, rng=rng),
+    "social_dominance_simulation": lambda rng: social_dominance_simulation(50, 5, rng=rng),
+    "social_dominance_incremental": lambda rng: social_dominance_simulation(50, 5, rng=rng, ranking="incremental"),
+    "social_dominance_rounds": lambda rng: social_dominance_rounds(50, 5, rng=rng),
+    "lotka_volterra_stochastic": lambda rng: lotka_volterra_stochastic(1.0, 0.1, 0.075, 1.5, 10, 5, 5.0, 20, rng=rng),
+    "lotka_volterra_tau_leaping": lambda rng: lotka_volterra_stochastic(1.0, 0.1, 0.075, 1.5, 100, 50, 5.0, 20,
+                                                                        method="tau-leaping", rng=rng),
+    "lotka_volterra_diffusion": lambda rng: lotka_volterra_diffusion(1.0, 0.1, 0.075, 1.5, 20, 10, 5, size=16,
+                                                                     rng=rng),
+}
+
+
+@pytest.mark.parametrize("name", RUNS)
+def test_same_seed_same_result(name):
+    assert_identical(RUNS[name](SEED), RUNS[name](SEED))
+
+
+@pytest.mark.parametrize("name", RUNS)
+def test_seed_and_generator_agree(name):
+    # Une graine entière et le générateur qu'elle désigne donnent le même résultat
+    assert_identical(RUNS[name](SEED), RUNS[name](np.random.default_rng(SEED)))
+
+
+def test_parallel_map_independent_of_workers():
+    tasks = [(2.0, cost, 100, 20, 10) for cost in (1.0, 2.0, 3.0, 4.0, 5.0)]
+    serial = parallel_map(hawk_dove_game_batch, tasks, seed=SEED, workers=1)
+    for workers in (2, 3):
+        assert_identical(serial, parallel_map(hawk_dove_game_batch, tasks, seed=SEED, workers=workers))
+
+
+def test_parallel_map_tasks_get_distinct_streams():
+    tasks = [(2.0, 3.0, 100, 20, 10)] * 2
+    first, second = parallel_map(hawk_dove_game_batch, tasks, seed=SEED, workers=1)
+    assert not np.array_equal(first, second)
+
+
+def sweep(directory, workers, chunk_size):
+    result = hawk_dove_sweep([1.0, 2.0, 3.0], [1.0, 2.0, 4.0], str(directory), replicates=5, generations=10,
+                             seed=SEED, workers=workers, chunk_size=chunk_size)
+    return {name: np.array(result[name]) for name in ("final_hawk_fraction", "convergence_generation", "done")}
+
+
+def test_sweep_independent_of_workers(tmp_path):
+    serial = sweep(tmp_path / "serial", workers=1, chunk_size=2)
+    assert serial["done"].all()
+    assert_identical(serial, sweep(tmp_path / "parallel", workers=2, chunk_size=2))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 4, 9])
+def test_sweep_independent_of_chunk_size(tmp_path, chunk_size):
+    assert_identical(sweep(tmp_path / "reference", workers=1, chunk_size=3),
+                     sweep(tmp_path / str(chunk_size), workers=1, chunk_size=chunk_size))
+
+
+@pytest.mark.parametrize("chunk_size", [2, 7, 64, 1001, 65536])
+def test_stream_independent_of_chunk_size(chunk_size):
+    steps = 1000
+    blocks = [(prey.copy(), predator.copy(), payoff.copy()) for prey, predator, payoff in
+              iter_lotka_volterra(0.1, 0.02, 0.01, 0.1, 40, 9, steps, chunk_size=chunk_size)]
+    reference = [(prey.copy(), predator.copy(), payoff.copy()) for prey, predator, payoff in
+                 iter_lotka_volterra(0.1, 0.02, 0.01, 0.1, 40, 9, steps, chunk_size=100)]
+    assert_identical(np.concatenate([block[0] for block in blocks]),
+                     np.concatenate([block[0] for block in reference]))
+    assert_identical(np.concatenate([block[1] for block in blocks]),
+                     np.concatenate([block[1] for block in reference]))
+    assert_identical(blocks[-1][2], reference[-1][2])
+
+
+@pytest.mark.parametrize("chunk_size", [3, 100, 65536])
+def test_npy_independent_of_chunk_size(tmp_path, chunk_size):
+    history, payoff_matrix = lotka_volterra_to_npy(str(tmp_path / f"{chunk_size}.npy"), 0.1, 0.02, 0.01, 0.1, 40, 9,
+                                                   500, chunk_size=chunk_size)
+    reference, reference_payoffs = lotka_volterra_to_npy(str(tmp_path / "reference.npy"), 0.1, 0.02, 0.01, 0.1,
+                                                         40, 9, 500, chunk_size=50)
+    assert_identical(np.array(history), np.array(reference))
+    assert_identical(payoff_matrix, reference_payoffs)
+
+
+def test_memory_mapped_dominance_history(tmp_path):
+    in_memory = social_dominance_simulation(50, 10, rng=SEED)
+    on_disk = social_dominance_simulation(50, 10, rng=SEED, history_dir=str(tmp_path))
+    assert_identical(in_memory, tuple(np.array(array) for array in on_disk))
+
+
+def test_lotka_volterra_is_deterministic():
+    assert_identical(lotka_volterra_with_payoff(0.1, 0.02, 0.01, 0.1, 40, 9, 500),
+                     lotka_volterra_with_payoff(0.1, 0.02, 0.01, 0.1, 40, 9, 500))
@@ -0,0 +1,121 @@
+import threading
+import time
+
+import pytest
+
+from simulations.runner import SimulationCancelled, SimulationRunner
+
+
+def blocking_simulation(release, steps=3, progress=None):
+    # Simulation qui attend `release` avant de dérouler ses pas
+    progress(0, steps)
+    assert release.wait(5)
+    for step in range(steps):
+        progress(step + 1, steps)
+    return steps
+
+
+def failing_simulation(progress=None):
+    raise ValueError("paramètres invalides")
+
+
+def wait(jobs):
+    for job in jobs:
+        try:
+            job.result(timeout=5)
+        except Exception:
+            pass
+
+
+def test_cancel_queued_job():
+    runner = SimulationRunner(workers=1)
+    release = threading.Event()
+    finished = []
+    running = runner.submit(blocking_simulation, release, on_done=finished.append)
+    queued = runner.submit(blocking_simulation, release, on_done=finished.append)
+    other = runner.submit(blocking_simulation, release, steps=2, on_done=finished.append)
+    queued.cancel()
+    release.set()
+    wait([running, queued, other])
+    runner.poll()
+
+    assert queued.cancelled and queued.done
+    with pytest.raises(SimulationCancelled):
+        queued.result()
+    assert (running.result(), other.result()) == (3, 2)
+    assert finished == [running, queued, other]
+    assert runner.jobs == []
+    assert runner.status() == "Aucune simulation en cours"
+    runner.shutdown()
+
+
+def test_cancel_running_job():
+    runner = SimulationRunner(workers=1)
+    release = threading.Event()
+    job = runner.submit(blocking_simulation, release)
+    while job.progress == (0, 0):
+        time.sleep(0.001)
+    job.cancel()
+    release.set()
+    with pytest.raises(SimulationCancelled):
+        job.result(timeout=5)
+    runner.shutdown()
+
+
+def test_poll_callback_order():
+    runner = SimulationRunner(workers=1)
+    release = threading.Event()
+    release.set()
+    events = []
+    succeeding = runner.submit(blocking_simulation, release, on_progress=lambda job: events.append(("progress", job)),
+                               on_done=lambda job: events.append(("done", job)))
+    failing = runner.submit(failing_simulation, on_done=lambda job: events.append(("done", job)))
+    wait([succeeding, failing])
+    assert events == []  # Rien n'est transmis hors de `poll`
+
+    runner.poll()
+    assert events == [("progress", succeeding), ("done", succeeding), ("done", failing)]
+    assert succeeding.progress == (3, 3)
+    with pytest.raises(ValueError, match="paramètres invalides"):
+        failing.result()
+    runner.poll()
+    assert len(events) == 3
+
+
+class FakeWidget:
+    """Remplace un widget Tk : `after` garde les appels programmés au lieu de les exécuter."""
+
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, interval, callback):
+        self.scheduled.append((interval, callback))
+
+
+def test_attach_rearms_polling():
+    runner = SimulationRunner(workers=1)
+    release = threading.Event()
+    release.set()
+    widget = FakeWidget()
+    finished = []
+    runner.attach(widget, interval=20)
+    assert [interval for interval, _ in widget.scheduled] == [20]
+
+    job = runner.submit(blocking_simulation, release, on_done=finished.append)
+    wait([job])
+    _, tick = widget.scheduled.pop()
+    tick()
+    assert finished == [job]
+    assert [interval for interval, _ in widget.scheduled] == [20]
+
+    # Une fonction de suivi en erreur n'arrête pas le suivi
+    def broken(job):
+        raise RuntimeError("fonction de suivi")
+
+    job = runner.submit(blocking_simulation, release, on_done=broken)
+    wait([job])
+    _, tick = widget.scheduled.pop()
+    with pytest.raises(RuntimeError):
+        tick()
+    assert len(widget.scheduled) == 1
+    runner.shutdown()